@@ -1,8 +1,10 @@
 import sys
-import json
 import os
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+from parsers import write_parquet_rows
 from parsers.csv_parser import parse_csv
 from etl_csv.chunking import chunk_csv_data
 
@@ -11,26 +13,25 @@ def save_locally(result, chunks, output_dir="output"):
     Save parsed and chunked data to the local file system.
     """
     def json_serializer(obj):
-        # Handle pandas NA/NaN values
-        if pd.isna(obj):
-            return None
-        # Handle NumPy integer types
-        elif isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
-            return int(obj)
-        # Handle NumPy floating types
-        elif isinstance(obj, (np.floating, np.float64, np.float32, np.float16)):
-            return float(obj)
-        # Handle NumPy boolean type
-        elif isinstance(obj, (np.bool_, bool)):
-            return bool(obj)
-        # Handle NumPy arrays
+        # orjson handles NumPy scalars/arrays and NaN natively; this only
+        # sees the leftovers. Cheap type checks run first so pd.isna is
+        # only reached for pandas NA/NaT-like objects.
+        if isinstance(obj, (np.integer, np.bool_)):
+            return obj.item()
+        elif isinstance(obj, (np.floating, float)):
+            # NaN is the only value not equal to itself
+            return None if obj != obj else float(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        # Handle other NumPy types by converting to Python native types
         elif isinstance(obj, np.generic):
             return obj.item()
+        elif pd.isna(obj):
+            return None
         # Raise error for other non-serializable types
         raise TypeError(f"Type {type(obj)} not serializable")
+
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    line_options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
     
     # Create output directory (if it doesn't exist)
     os.makedirs(output_dir, exist_ok=True)
@@ -39,24 +40,65 @@ def save_locally(result, chunks, output_dir="output"):
     filename_base = os.path.basename(result["metadata"].get("filename", "csv_file"))
     filename_without_ext = os.path.splitext(filename_base)[0]
     
-    # Save document data
-    doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.json")
-    with open(doc_output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, default=json_serializer, ensure_ascii=False, indent=2)
+    # Save document data: rows go to Parquet with the rest of the result in a
+    # small JSON sidecar, falling back to a single JSON document if needed
+    data_file = f"{filename_without_ext}_data.parquet"
+    if write_parquet_rows(result["data"], result["columns"], os.path.join(output_dir, data_file)):
+        doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.meta.json")
+        document = {key: value for key, value in result.items() if key != "data"}
+        document["data_files"] = data_file
+    else:
+        doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.json")
+        document = result
+    with open(doc_output_path, 'wb') as f:
+        f.write(orjson.dumps(document, default=json_serializer, option=options))
     
-    # Save chunked data
-    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.json")
-    with open(chunks_output_path, 'w', encoding='utf-8') as f:
-        json.dump(chunks, f, default=json_serializer, ensure_ascii=False, indent=2)
+    # Save chunked data as newline-delimited JSON, one chunk per line
+    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.jsonl")
+    with open(chunks_output_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(orjson.dumps(chunk, default=json_serializer, option=line_options))
     
     print(f"Document saved to: {doc_output_path}")
     print(f"Chunk data saved to: {chunks_output_path}")
 
+def _parse_and_chunk(file_path):
+    """
+    Parse and chunk a single CSV file.
+    
+    Defined at module level so it can be pickled for the process pool.
+    Returns (file_path, result, chunks); chunks is None if parsing failed.
+    """
+    result = parse_csv(file_path)
+    if "error" in result:
+        return file_path, result, None
+    return file_path, result, chunk_csv_data(result)
+
+def main_batch(paths, output_dir="output"):
+    """
+    Parse and chunk several CSV files in parallel, then save each result.
+    
+    Args:
+        paths (list): Paths of the files to process
+        output_dir (str): Output directory
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_path, result, chunks in executor.map(_parse_and_chunk, paths):
+            if chunks is None:
+                print(f"Parsing failed for {file_path}: {result['error']}")
+                continue
+            save_locally(result, chunks, output_dir)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python main_csv.py <csv_file_path>")
+        print("       python main_csv.py --batch <csv_file_path> [...]")
         sys.exit(1)
 
+    if sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+        sys.exit(0)
+
     file_path = sys.argv[1]
 
     # Check if file exists
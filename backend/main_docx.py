@@ -1,6 +1,7 @@
 import sys
-import json
 import os
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from parsers.docx_parser import parse_docx
 from etl_docx.chunking import semantic_chunk_text
 
@@ -16,6 +17,9 @@ def save_locally(result, chunks, output_dir="output"):
         chunks (list): Data processed through chunking
         output_dir (str): Output directory
     """
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    line_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
     # Create output directory (if it doesn't exist)
     os.makedirs(output_dir, exist_ok=True)
     
@@ -25,21 +29,54 @@ def save_locally(result, chunks, output_dir="output"):
     
     # Save document data
     doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.json")
-    with open(doc_output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    with open(doc_output_path, 'wb') as f:
+        f.write(orjson.dumps(result, option=options))
     
-    # Save chunked data
-    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.json")
-    with open(chunks_output_path, 'w', encoding='utf-8') as f:
-        json.dump(chunks, f, ensure_ascii=False, indent=2)
+    # Save chunked data as newline-delimited JSON, one chunk per line
+    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.jsonl")
+    with open(chunks_output_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(orjson.dumps(chunk, option=line_options))
     
     print(f"Document saved to: {doc_output_path}")
     print(f"Chunk data saved to: {chunks_output_path}")
 
+def _parse_and_chunk(file_path):
+    """
+    Parse and chunk a single DOCX file.
+    
+    Defined at module level so it can be pickled for the process pool.
+    Returns (file_path, result, chunks); chunks is None if parsing failed.
+    """
+    result = parse_docx(file_path)
+    if "error" in result:
+        return file_path, result, None
+    return file_path, result, semantic_chunk_text(result["sections"])
+
+def main_batch(paths, output_dir="output"):
+    """
+    Parse and chunk several DOCX files in parallel, then save each result.
+    
+    Args:
+        paths (list): Paths of the files to process
+        output_dir (str): Output directory
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_path, result, chunks in executor.map(_parse_and_chunk, paths):
+            if chunks is None:
+                print(f"Parsing failed for {file_path}: {result['error']}")
+                continue
+            save_locally(result, chunks, output_dir)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python main.py <docx_file_path>")
+        print("       python main.py --batch <docx_file_path> [...]")
         sys.exit(1)
+
+    if sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+        sys.exit(0)
         
     file_path = sys.argv[1]
     
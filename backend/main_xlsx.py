@@ -1,7 +1,9 @@
 import sys
-import json
 import os
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+from parsers import write_parquet_rows
 from parsers.excel_parser import parse_excel    
 from etl_xlsx.chunking import chunk_excel_data
 def save_locally(result, chunks, output_dir="output"):
@@ -12,6 +14,10 @@ def save_locally(result, chunks, output_dir="output"):
         if pd.isna(obj):
             return None
         raise TypeError(f"Type {type(obj)} not serializable")
+
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    line_options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
     # Create output directory (if it doesn't exist)
     os.makedirs(output_dir, exist_ok=True)
     
@@ -19,24 +25,83 @@ def save_locally(result, chunks, output_dir="output"):
     filename_base = os.path.basename(result["metadata"].get("filename", "spreadsheet"))
     filename_without_ext = os.path.splitext(filename_base)[0]
     
-    # Save document data
-    doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.json")
-    with open(doc_output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, default=json_serializer, ensure_ascii=False, indent=2)
+    # Save document data: one Parquet file per sheet with the rest of the
+    # result in a small JSON sidecar, falling back to a single JSON document
+    data_files = {}
+    written = []
+    try:
+        for index, (sheet_name, rows) in enumerate(result["data"].items()):
+            data_file = f"{filename_without_ext}_sheet{index}.parquet"
+            headers = result["metadata"]["columns"].get(sheet_name, [])
+            data_path = os.path.join(output_dir, data_file)
+            if not write_parquet_rows(rows, headers, data_path):
+                data_files = None
+                break
+            written.append(data_path)
+            data_files[sheet_name] = data_file
+    finally:
+        # Don't leave the earlier sheets' files behind when a later sheet
+        # can't be written and the result falls back to a single JSON file
+        if len(written) < len(result["data"]):
+            for data_path in written:
+                os.remove(data_path)
     
-    # Save chunked data
-    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.json")
-    with open(chunks_output_path, 'w', encoding='utf-8') as f:
-        json.dump(chunks, f, default=json_serializer, ensure_ascii=False, indent=2)
+    if data_files is not None:
+        doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.meta.json")
+        document = {key: value for key, value in result.items() if key != "data"}
+        document["data_files"] = data_files
+    else:
+        doc_output_path = os.path.join(output_dir, f"{filename_without_ext}_document.json")
+        document = result
+    with open(doc_output_path, 'wb') as f:
+        f.write(orjson.dumps(document, default=json_serializer, option=options))
+    
+    # Save chunked data as newline-delimited JSON, one chunk per line
+    chunks_output_path = os.path.join(output_dir, f"{filename_without_ext}_chunks.jsonl")
+    with open(chunks_output_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(orjson.dumps(chunk, default=json_serializer, option=line_options))
     
     print(f"Document saved to: {doc_output_path}")
     print(f"Chunk data saved to: {chunks_output_path}")
 
+def _parse_and_chunk(file_path):
+    """
+    Parse and chunk a single Excel file.
+    
+    Defined at module level so it can be pickled for the process pool.
+    Returns (file_path, result, chunks); chunks is None if parsing failed.
+    """
+    result = parse_excel(file_path)
+    if "error" in result:
+        return file_path, result, None
+    return file_path, result, chunk_excel_data(result)
+
+def main_batch(paths, output_dir="output"):
+    """
+    Parse and chunk several Excel files in parallel, then save each result.
+    
+    Args:
+        paths (list): Paths of the files to process
+        output_dir (str): Output directory
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file_path, result, chunks in executor.map(_parse_and_chunk, paths):
+            if chunks is None:
+                print(f"Parsing failed for {file_path}: {result['error']}")
+                continue
+            save_locally(result, chunks, output_dir)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python excel_parser.py <excel_file_path>")
+        print("       python excel_parser.py --batch <excel_file_path> [...]")
         sys.exit(1)
 
+    if sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+        sys.exit(0)
+
     file_path = sys.argv[1]
 
     # Check if file exists
@@ -10,11 +10,39 @@ Main components:
 
 import os
 import logging
+import functools
+import importlib
+from concurrent.futures import ProcessPoolExecutor
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Optional columnar storage for parsed tabular data
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Extension -> (parser module, function). Non-PDF parsers are imported on
+# first use so their optional dependencies don't load with the ETL pipeline.
+_PARSER_MODULES = {
+    "xlsx": ("excel_parser", "parse_excel"),
+    "xls": ("excel_parser", "parse_excel"),
+    "docx": ("docx_parser", "parse_docx"),
+    "pptx": ("pptx_parser", "parse_pptx"),
+    "csv": ("csv_parser", "parse_csv"),
+    "xml": ("xml_parser", "parse_xml"),
+    "png": ("image_parser", "parse_image"),
+    "jpg": ("image_parser", "parse_image"),
+    "jpeg": ("image_parser", "parse_image"),
+    "tiff": ("image_parser", "parse_image"),
+}
+
+# Parsers available without a lazy import, filled in below
+_PARSERS = {}
+
 # Import core functionality
 try:
     from .esg_pdf_etl import run_etl_pipeline, extract_from_pdf, transform_content, load_chunks
@@ -35,6 +63,8 @@ try:
         """
         return extract_from_pdf(file_path)
     
+    _PARSERS["pdf"] = parse_pdf
+    
     # Only import other parsers if explicitly requested (avoids warnings)
     _SUPPRESS_PARSER_WARNINGS = True
     parse_excel = None
@@ -44,41 +74,155 @@ try:
     parse_image = None
     parse_xml = None
     
-    def parse_file(file_path):
-        """
-        Parse a file based on its extension.
-        
-        Args:
-            file_path (str): Path to the file
-            
-        Returns:
-            dict: Parsed data
-        """
-        if not os.path.exists(file_path):
-            return {"error": f"File not found: {file_path}"}
-        
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()[1:]  # Remove the dot
-        
-        # For PDF ETL, we only care about PDF files
-        if ext in ['pdf']:
-            return parse_pdf(file_path)
-        else:
-            return {"error": f"Only PDF files are supported in ETL mode"}
-    
 except ImportError as e:
     logger.error(f"Error importing parsers: {str(e)}")
     
     # Define empty functions as placeholders
-    def parse_file(file_path):
-        return {"error": "Parsers not available"}
-    
     def parse_pdf(file_path):
         return {"error": "PDF parser not available"}
     
+    _PARSERS["pdf"] = parse_pdf
+    
     run_etl_pipeline = None
     extract_from_pdf = None
     transform_content = None
     load_chunks = None
 
-# Empty file to mark as package 
\ No newline at end of file
+@functools.cache
+def _get_parser(ext):
+    """Return the parse function for an extension, importing its module on first use."""
+    if ext in _PARSERS:
+        return _PARSERS[ext]
+    if ext not in _PARSER_MODULES:
+        return None
+    
+    module_name, function_name = _PARSER_MODULES[ext]
+    try:
+        module = importlib.import_module(f".{module_name}", __package__)
+    except ImportError as e:
+        logger.error(f"Error importing {module_name}: {str(e)}")
+        return None
+    return getattr(module, function_name)
+
+def parse_file(file_path):
+    """
+    Parse a file based on its extension.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        dict: Parsed data
+    """
+    if not os.path.exists(file_path):
+        return {"error": f"File not found: {file_path}"}
+    
+    _, ext = os.path.splitext(file_path)
+    ext = ext.lower()[1:]  # Remove the dot
+    
+    parser = _get_parser(ext)
+    if parser is None:
+        return {"error": f"Unsupported file type: {ext}"}
+    return parser(file_path)
+
+def init_worker_logging(level=logging.INFO):
+    """
+    Process pool initializer that sets up logging in a worker.
+    
+    Workers started with spawn or forkserver do not inherit the parent's
+    handlers, so without this their log records are lost. Under fork the
+    root logger already has handlers and this is a no-op.
+    
+    Args:
+        level (int): Root log level, usually the parent's effective level
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+def parse_files(file_paths, max_workers=None, chunksize=1):
+    """
+    Parse several files in parallel worker processes.
+    
+    Parsing and cleaning are CPU-bound and hold the GIL, so independent
+    files are spread over a process pool rather than threads.
+    
+    Args:
+        file_paths (list): Paths of the files to parse
+        max_workers (int): Worker processes (defaults to the CPU count)
+        chunksize (int): Files sent to a worker per task; raise it for many
+            small files to amortize inter-process overhead
+        
+    Returns:
+        list: Parsed data for each file, in the order of file_paths
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < 2:
+        return [parse_file(file_path) for file_path in file_paths]
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             initializer=init_worker_logging,
+                             initargs=(logging.getLogger().getEffectiveLevel(),)) as executor:
+        return list(executor.map(parse_file, file_paths, chunksize=chunksize))
+
+def write_parquet_rows(rows, columns, output_path):
+    """
+    Write row-oriented parser output to a zstd-compressed Parquet file.
+    
+    Args:
+        rows (list): Data rows as lists of values
+        columns (list): Column names for the rows
+        output_path (str): Destination .parquet path
+        
+    Returns:
+        bool: True if the file was written, False if pyarrow is missing or
+              cannot type the data (e.g. mixed-type or duplicate columns)
+    """
+    if not PYARROW_AVAILABLE:
+        return False
+    
+    try:
+        import pandas as pd
+        df = pd.DataFrame(rows, columns=[str(col) for col in columns])
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, output_path, compression="zstd")
+        return True
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        logger.warning(f"Could not write Parquet file {output_path}: {str(e)}")
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return False
+
+def load_tabular_output(meta_path):
+    """
+    Load a CSV/XLSX result saved as a JSON sidecar plus Parquet data files.
+    
+    Args:
+        meta_path (str): Path to the *_document.meta.json sidecar
+        
+    Returns:
+        dict: The parsed result with "data" restored as rows, either a list
+              (CSV) or a dict of sheet name to rows (XLSX)
+    """
+    import json
+    
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    
+    data_files = result.pop("data_files", None)
+    if data_files is None:
+        return result
+    if not PYARROW_AVAILABLE:
+        return {"error": "pyarrow is required to load Parquet data files"}
+    
+    base_dir = os.path.dirname(meta_path)
+    
+    def read_rows(filename):
+        columns = pq.read_table(os.path.join(base_dir, filename)).to_pydict().values()
+        return [list(row) for row in zip(*columns)]
+    
+    if isinstance(data_files, dict):
+        result["data"] = {sheet: read_rows(filename) for sheet, filename in data_files.items()}
+    else:
+        result["data"] = read_rows(data_files)
+    return result
@@ -8,10 +8,20 @@ The main function is parse_csv(), which extracts data from CSV files
 and returns it in a structured format.
 """
 
+import io
 import os
+import re
 import logging
-import chardet
-from typing import Dict, List, Any, Union
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union
+
+# Prefer the C implementation of the chardet API when it is installed
+try:
+    import cchardet as chardet
+except ImportError:
+    import chardet
 
 # Import utility functions
 from .utils import safe_parse, create_result_dict
@@ -32,10 +42,128 @@ except ImportError:
     PANDAS_AVAILABLE = False
     logger.warning("pandas not available. CSV parsing will be limited.")
 
+# pyarrow's CSV reader parses blocks in parallel; pandas is the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Arrow-backed string dtype for text columns of low-memory reads
+if PANDAS_AVAILABLE and PYARROW_AVAILABLE:
+    _ARROW_STRING_DTYPE = pd.StringDtype("pyarrow")
+    _ARROW_STRING_TYPES = {pa.string(): _ARROW_STRING_DTYPE, pa.large_string(): _ARROW_STRING_DTYPE}
+
+# Upper bound on the bytes fed to the encoding detector
+ENCODING_SAMPLE_SIZE = 10000
+ENCODING_CHUNK_SIZE = 2048
+# Byte order marks, UTF-32 before the UTF-16 prefix of its LE mark, with
+# the names chardet reports for them
+_BOMS = (
+    (b'\xef\xbb\xbf', 'UTF-8-SIG'),
+    (b'\xff\xfe\x00\x00', 'UTF-32'),
+    (b'\x00\x00\xfe\xff', 'UTF-32'),
+    (b'\xff\xfe', 'UTF-16'),
+    (b'\xfe\xff', 'UTF-16'),
+)
+
+# Bytes read once by _sniff_dialect for encoding, delimiter and header detection
+SNIFF_SAMPLE_SIZE = 65536
+
+# Candidate delimiters in tie-break order, and the lines sampled to score them
+_DELIMITERS = (',', ';', '\t', '|')
+DELIMITER_SAMPLE_LINES = 10
+_QUOTED_FIELD_RE = re.compile(r'"[^"]*"')
+
+# Rows sampled to decide which text columns become categoricals, and the
+# unique-value ratio below which they do
+DTYPE_SAMPLE_ROWS = 1000
+CATEGORY_MAX_RATIO = 0.5
+
+# Files above STREAMING_THRESHOLD bytes are read in chunks: statistics
+# cover the whole file, returned rows are capped at STREAM_PREVIEW_ROWS
+STREAMING_THRESHOLD = 200 << 20
+STREAM_CHUNK_ROWS = 200_000
+STREAM_PREVIEW_ROWS = 1000
+
+# Column count from which the IQR quartiles and transform_numerical_data's
+# conversions run in threads
+PARALLEL_MIN_COLUMNS = 16
+
+# Values kept per column to estimate the median of a streamed file
+MEDIAN_RESERVOIR_SIZE = 100_000
+
+# Column name standardization: spaces and hyphens become underscores and
+# special characters are dropped
+_CLEAN_TRANS = str.maketrans({' ': '_', '-': '_', **{c: None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'}})
+
+def _read_head(file_path: str, size: int) -> bytes:
+    """
+    Read up to size bytes from the start of a file.
+    
+    Uses an unbuffered descriptor, since the bytes are read once and
+    handed straight to detection, and hints sequential access where the
+    platform supports it.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+def _detect_encoding_from_bytes(raw: bytes) -> str:
+    """
+    Detect the encoding of up to ENCODING_SAMPLE_SIZE bytes.
+    
+    BOMs, pure ASCII and valid UTF-8 are recognised directly; anything else
+    is fed to the detector in chunks, stopping once it is done.
+    """
+    sample = raw[:ENCODING_SAMPLE_SIZE]
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    if sample.isascii():
+        return 'ascii'
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off by the sample boundary is fine
+        if e.reason == 'unexpected end of data' and e.end == len(sample) < len(raw):
+            return 'utf-8'
+    
+    detector = chardet.UniversalDetector()
+    for start in range(0, len(sample), ENCODING_CHUNK_SIZE):
+        detector.feed(sample[start:start + ENCODING_CHUNK_SIZE])
+        if detector.done:
+            break
+    detector.close()
+    return detector.result['encoding'] or 'utf-8'
+
+@functools.lru_cache(maxsize=256)
+def _detect_encoding_cached(file_path: str, mtime: float, size: int) -> str:
+    """Run the incremental detector; mtime and size make the cache key change with the file."""
+    return _detect_encoding_from_bytes(_read_head(file_path, ENCODING_SAMPLE_SIZE))
+
 def detect_encoding(file_path: str) -> str:
     """
     Detect the encoding of a CSV file.
     
+    The first bytes are fed to the detector in small chunks, stopping as
+    soon as it is confident. Results are cached per (path, mtime, size) so
+    re-parsing an unchanged file skips detection.
+    
     Args:
         file_path (str): Path to the CSV file
         
@@ -43,9 +171,8 @@ def detect_encoding(file_path: str) -> str:
         str: Detected encoding or 'utf-8' as default
     """
     try:
-        with open(file_path, 'rb') as f:
-            result = chardet.detect(f.read(10000))
-            return result['encoding'] or 'utf-8'
+        stat = os.stat(file_path)
+        return _detect_encoding_cached(file_path, stat.st_mtime, stat.st_size)
     except Exception as e:
         logger.warning(f"Error detecting encoding: {str(e)}")
         return 'utf-8'
@@ -63,26 +190,44 @@ def detect_delimiter(file_path: str, encoding: str) -> str:
     """
     try:
         with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-            first_line = f.readline()
-            
-            # Count potential delimiters
-            delimiters = [',', ';', '\t', '|']
-            counts = {d: first_line.count(d) for d in delimiters}
-            
-            # Get the delimiter with the most occurrences
-            max_count = 0
-            delimiter = ','
-            
-            for d, count in counts.items():
-                if count > max_count:
-                    max_count = count
-                    delimiter = d
-            
-            return delimiter
+            return _delimiter_from_lines(f)
     except Exception as e:
         logger.warning(f"Error detecting delimiter: {str(e)}")
         return ','
 
+def _delimiter_from_lines(lines) -> str:
+    """
+    Pick the candidate delimiter giving the most consistent field count.
+    
+    Looks at the first DELIMITER_SAMPLE_LINES non-blank, non-comment lines
+    with quoted fields removed. Each candidate is scored by how many lines
+    share its most common non-zero count, then by that count; remaining
+    ties go to the earlier candidate, ',' by default.
+    """
+    sample = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        sample.append(_QUOTED_FIELD_RE.sub('', line))
+        if len(sample) >= DELIMITER_SAMPLE_LINES:
+            break
+    
+    delimiter = ','
+    best_score = (0, 0)
+    for d in _DELIMITERS:
+        counts = Counter(line.count(d) for line in sample)
+        counts.pop(0, None)
+        if not counts:
+            continue
+        count, lines_agreeing = counts.most_common(1)[0]
+        score = (lines_agreeing, count)
+        if score > best_score:
+            best_score = score
+            delimiter = d
+    
+    return delimiter
+
 def detect_header_row(file_path: str, encoding: str, delimiter: str, max_rows: int = 30) -> int:
     """
     Detect the most likely header row in a CSV file using heuristics.
@@ -97,26 +242,33 @@ def detect_header_row(file_path: str, encoding: str, delimiter: str, max_rows: i
     Returns:
         int: 0-based file line index of the detected header row
     """
-    import pandas as pd
-    import io
+    with open(file_path, 'r', encoding=encoding, errors='replace') as f:
+        return _header_row_from_lines(f, delimiter, max_rows, file_path)
+
+def _header_row_from_lines(lines, delimiter: str, max_rows: int, file_path: str) -> int:
+    """Run header detection over an iterable of file lines; see detect_header_row."""
     rows = []
     file_line_indices = []
-    with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-        for i, line in enumerate(f):
-            if len(rows) >= max_rows:
-                break
-            if line.strip() == '' or line.strip().startswith('#'):
-                continue
-            rows.append(line)
-            file_line_indices.append(i)
+    for i, line in enumerate(lines):
+        if len(rows) >= max_rows:
+            break
+        if line.strip() == '' or line.strip().startswith('#'):
+            continue
+        rows.append(line)
+        file_line_indices.append(i)
     if not rows:
         return 0
     # Read as DataFrame (no header)
-    sample_csv = io.StringIO(''.join(rows))
+    sample_csv = ''.join(rows)
     try:
-        df_sample = pd.read_csv(sample_csv, sep=delimiter, header=None, engine='python')
+        # The C engine infers the same types as the python engine at a
+        # fraction of the start-up cost; python stays as the fallback
+        df_sample = pd.read_csv(io.StringIO(sample_csv), sep=delimiter, header=None, engine='c')
     except Exception:
-        return 0
+        try:
+            df_sample = pd.read_csv(io.StringIO(sample_csv), sep=delimiter, header=None, engine='python')
+        except Exception:
+            return 0
     header_idx_in_sample = _find_real_header_index(df_sample, max_rows_to_check=max_rows)
     # Map back to the file line index
     if header_idx_in_sample < len(file_line_indices):
@@ -126,7 +278,177 @@ def detect_header_row(file_path: str, encoding: str, delimiter: str, max_rows: i
     logger.info(f"Detected header row at file line index {header_file_line_idx} for file {file_path}")
     return header_file_line_idx
 
-def extract_data_with_pandas(file_path: str, encoding: str = 'utf-8', delimiter: str = ',') -> Dict[str, Any]:
+@functools.lru_cache(maxsize=256)
+def _sniff_dialect_cached(file_path: str, mtime: float, size: int, max_rows: int) -> tuple:
+    # One byte past the sample tells whether the file continues
+    raw = _read_head(file_path, SNIFF_SAMPLE_SIZE + 1)
+    at_eof = len(raw) <= SNIFF_SAMPLE_SIZE
+    return _sniff_dialect_from_bytes(raw[:SNIFF_SAMPLE_SIZE], at_eof, file_path, max_rows)
+
+def _sniff_dialect_from_bytes(raw: bytes, at_eof: bool, file_path: str, max_rows: int = 30) -> tuple:
+    """Detect (encoding, delimiter, header_row) from the head of a file; see _sniff_dialect."""
+    encoding = _detect_encoding_from_bytes(raw)
+    # Same newline handling as a text-mode open() of the file
+    lines = io.StringIO(raw.decode(encoding, errors='replace'), newline=None).readlines()
+    if not at_eof and lines:
+        # The last line may be cut off by the sample boundary
+        lines.pop()
+    
+    delimiter = _delimiter_from_lines(lines)
+    
+    complete_lines = [line for line in lines if line.strip() and not line.strip().startswith('#')]
+    if at_eof or len(complete_lines) >= max_rows:
+        header_row = _header_row_from_lines(lines, delimiter, max_rows, file_path)
+    else:
+        # Very long lines: the sample doesn't hold enough rows, scan the file
+        header_row = detect_header_row(file_path, encoding, delimiter, max_rows)
+    return encoding, delimiter, header_row
+
+def _sniff_dialect(file_path: str, max_rows: int = 30) -> tuple:
+    """
+    Detect encoding, delimiter and header row with a single read of the file head.
+    
+    Reads the first SNIFF_SAMPLE_SIZE bytes once, detects the encoding on the
+    raw bytes, decodes once and runs delimiter and header detection on the
+    decoded lines. Results are cached per (path, mtime, size).
+    
+    Args:
+        file_path (str): Path to the CSV file
+        max_rows (int): Number of lines to scan for header detection
+        
+    Returns:
+        tuple: (encoding, delimiter, header_row)
+    """
+    stat = os.stat(file_path)
+    return _sniff_dialect_cached(file_path, stat.st_mtime, stat.st_size, max_rows)
+
+def _read_csv_frame(file_path: str, encoding: str, delimiter: str, header_row: int,
+                    raw: Optional[bytes] = None, dict_encode: bool = False) -> "pd.DataFrame":
+    """
+    Read the CSV body into a DataFrame, starting at the detected header line.
+    
+    Uses pyarrow's multithreaded block parser when available and falls back
+    to pandas' C parser when pyarrow is missing or rejects the file (e.g.
+    ragged rows, which pandas pads with NaN). When the whole file is passed
+    as raw, it is parsed from memory instead of reopening file_path. With
+    dict_encode, pyarrow dictionary-encodes low-cardinality text columns
+    while parsing, which arrive in pandas as categoricals, and the remaining
+    text columns stay in Arrow buffers as "string[pyarrow]".
+    """
+    def source():
+        return io.BytesIO(raw) if raw is not None else file_path
+    
+    if PYARROW_AVAILABLE:
+        try:
+            read_options = pacsv.ReadOptions(
+                encoding=encoding,
+                skip_rows=header_row,  # Skip all lines before the detected header
+                block_size=4 << 20,
+                use_threads=True,
+            )
+            parse_options = pacsv.ParseOptions(delimiter=delimiter)
+            table = pacsv.read_csv(
+                source(),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True, auto_dict_encode=dict_encode),
+            )
+            # pandas leaves date-like text as strings; re-read any columns
+            # pyarrow inferred as temporal with an explicit string type
+            temporal = {
+                field.name: pa.string() for field in table.schema
+                if pa.types.is_temporal(field.type)
+            }
+            if temporal:
+                table = pacsv.read_csv(
+                    source(),
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=pacsv.ConvertOptions(strings_can_be_null=True, auto_dict_encode=dict_encode,
+                                                         column_types=temporal),
+                )
+            # Name blank headers the way pandas does; leave duplicate
+            # headers to pandas, which de-duplicates them as "name.1"
+            names = [name if name else f"Unnamed: {i}" for i, name in enumerate(table.column_names)]
+            if len(set(names)) == len(names):
+                table = table.rename_columns(names)
+                # Keep text in Arrow buffers rather than one PyObject per cell
+                types_mapper = _ARROW_STRING_TYPES.get if dict_encode else None
+                return table.to_pandas(use_threads=True, split_blocks=True, self_destruct=True,
+                                       types_mapper=types_mapper)
+        except (pa.ArrowException, ValueError) as e:
+            logger.info(f"pyarrow could not read {file_path}, falling back to pandas: {str(e)}")
+    
+    return pd.read_csv(
+        source(),
+        encoding=encoding,
+        sep=delimiter,
+        na_filter=True,
+        na_values=[''],  # Empty fields become NaN while tokenizing
+        header=0,  # Use first row after skiprows as header
+        skiprows=header_row,  # Skip all lines before the detected header
+        engine='c',
+        low_memory=False  # Infer each column's type once, not per internal chunk
+    )
+
+def _downcast_dtypes(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Shrink a freshly read DataFrame to the smallest lossless dtypes.
+    
+    Integer columns are downcast over their full range, float columns only
+    when float32 holds every value exactly, and text columns whose sampled
+    unique ratio is below CATEGORY_MAX_RATIO become categoricals. Other
+    text columns move to Arrow-backed strings when pyarrow is available.
+    The numeric downcasts only last until transform_numerical_data, which
+    widens numeric columns to Int64 or float64 again.
+    """
+    sample = df.head(DTYPE_SAMPLE_ROWS)
+    for col in df.columns:
+        series = df[col]
+        try:
+            if pd.api.types.is_integer_dtype(series.dtype):
+                df[col] = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_float_dtype(series.dtype):
+                downcast = pd.to_numeric(series, downcast='float')
+                if downcast.dtype != series.dtype and np.array_equal(
+                        downcast.to_numpy(dtype='float64'), series.to_numpy(), equal_nan=True):
+                    df[col] = downcast
+            elif series.dtype == object and len(sample):
+                if sample[col].nunique() / len(sample) < CATEGORY_MAX_RATIO:
+                    df[col] = series.astype('category')
+                elif PYARROW_AVAILABLE and pd.api.types.infer_dtype(series, skipna=True) == "string":
+                    df[col] = series.astype(_ARROW_STRING_DTYPE)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not downcast column '{col}': {str(e)}")
+    return df
+
+def _frame_payload(df: "pd.DataFrame", layout: Optional[str]) -> Dict[str, Any]:
+    """
+    Materialize a DataFrame in the requested result layout.
+    
+    "rows" gives ``{"data": [[...], ...]}``, "columnar" gives
+    ``{"column_data": {col: [...]}}`` and None keeps only the DataFrame
+    (for intermediate pipeline steps). Missing values become None.
+    """
+    if layout is None:
+        return {"dataframe": df}
+    # Box each column once; only columns with missing values need the
+    # object cast that turns NaN/NA into None
+    column_lists = []
+    for index in range(df.shape[1]):
+        series = df.iloc[:, index]
+        if series.hasnans:
+            series = series.astype(object).where(series.notna(), None)
+        column_lists.append(series.tolist())
+    if layout == "columnar":
+        return {"column_data": dict(zip(df.columns, column_lists))}
+    if not column_lists:
+        return {"data": [[] for _ in range(len(df))]}
+    return {"data": [list(row) for row in zip(*column_lists)]}
+
+def extract_data_with_pandas(file_path: str, encoding: str = 'utf-8', delimiter: str = ',', header_row: int = None,
+                             layout: Optional[str] = "rows", low_memory_dtypes: bool = False,
+                             raw: Optional[bytes] = None, include_statistics: bool = True) -> Dict[str, Any]:
     """
     Extract data from a CSV file using pandas, with robust header detection.
     
@@ -134,6 +456,13 @@ def extract_data_with_pandas(file_path: str, encoding: str = 'utf-8', delimiter:
         file_path (str): Path to the CSV file
         encoding (str): File encoding
         delimiter (str): CSV delimiter
+        header_row (int): 0-based file line index of the header; detected if None
+        layout (str): "rows", "columnar", or None to return only the DataFrame
+        low_memory_dtypes (bool): Downcast numeric columns and turn repetitive
+            text columns into categoricals after reading
+        raw (bytes): Full file contents already in memory, parsed instead of
+            reopening file_path
+        include_statistics (bool): Compute statistics for numerical columns
         
     Returns:
         Dict[str, Any]: Extracted data and metadata
@@ -142,38 +471,25 @@ def extract_data_with_pandas(file_path: str, encoding: str = 'utf-8', delimiter:
         return create_result_dict(error="pandas is not available for CSV parsing.")
     try:
         # Detect header row (file line index)
-        header_row = detect_header_row(file_path, encoding, delimiter)
+        if header_row is None:
+            header_row = detect_header_row(file_path, encoding, delimiter)
         # Read CSV file into DataFrame using detected header
-        # Skip all lines before the header row
-        df = pd.read_csv(
-            file_path,
-            encoding=encoding,
-            sep=delimiter,
-            na_filter=True,
-            header=0,  # Use first row after skiprows as header
-            skiprows=header_row  # Skip all lines before the detected header
-        )
+        df = _read_csv_frame(file_path, encoding, delimiter, header_row, raw, dict_encode=low_memory_dtypes)
+        if low_memory_dtypes:
+            df = _downcast_dtypes(df)
         # Extract column names
         columns = df.columns.tolist()
-        # Extract data
-        data = df.values.tolist()
         # Debug logging for diagnosis
         logger.info(f"[DEBUG] Header row used (file line index): {header_row}")
         logger.info(f"[DEBUG] Columns detected: {columns}")
-        logger.info(f"[DEBUG] First 3 data rows: {data[:3]}")
-        # Generate statistics for numerical columns
-        stats = {}
-        for column in df.select_dtypes(include=['number']).columns:
-            stats[column] = {
-                "min": df[column].min(),
-                "max": df[column].max(),
-                "mean": df[column].mean(),
-                "median": df[column].median(),
-                "std": df[column].std()
-            }
+        logger.info(f"[DEBUG] First 3 data rows: {df.head(3).values.tolist()}")
+        # Generate statistics for numerical columns; intermediate
+        # extractions skip them, as cleaning changes the values
+        stats = _numeric_statistics(df) if layout is not None and include_statistics else {}
         result = {
             "columns": columns,
-            "data": data,
+            **_frame_payload(df, layout),
+            "dataframe": df,  # Handed to clean_and_transform_data as is
             "shape": df.shape,
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
         }
@@ -184,7 +500,127 @@ def extract_data_with_pandas(file_path: str, encoding: str = 'utf-8', delimiter:
         logger.error(f"Error extracting data with pandas: {str(e)}")
         return create_result_dict(error=f"Error parsing CSV file: {str(e)}")
 
-def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
+def _new_accumulator() -> Dict[str, Any]:
+    """Running statistics for one numeric column of a streamed CSV."""
+    return {"n": 0, "mean": 0.0, "m2": 0.0, "min": None, "max": None,
+            "sample": np.empty(MEDIAN_RESERVOIR_SIZE), "filled": 0}
+
+def _update_accumulator(acc: Dict[str, Any], series: "pd.Series", rng) -> None:
+    """Fold one chunk of a column into its accumulator."""
+    series = series.dropna()
+    if series.empty:
+        return
+    values = series.to_numpy(dtype='float64')
+    
+    # Min/max on the series keep integer columns integral
+    chunk_min, chunk_max = _to_native(series.min()), _to_native(series.max())
+    acc["min"] = chunk_min if acc["min"] is None else min(acc["min"], chunk_min)
+    acc["max"] = chunk_max if acc["max"] is None else max(acc["max"], chunk_max)
+    
+    # Reservoir sample for the median: fill first, then keep the i-th value
+    # seen with probability MEDIAN_RESERVOIR_SIZE / i
+    sample, filled, seen = acc["sample"], acc["filled"], acc["n"]
+    take = min(MEDIAN_RESERVOIR_SIZE - filled, len(values))
+    sample[filled:filled + take] = values[:take]
+    acc["filled"] = filled + take
+    rest = values[take:]
+    if len(rest):
+        positions = seen + take + np.arange(1, len(rest) + 1)
+        keep = rng.random(len(rest)) < MEDIAN_RESERVOIR_SIZE / positions
+        sample[rng.integers(0, MEDIAN_RESERVOIR_SIZE, keep.sum())] = rest[keep]
+    
+    # Merge the chunk's mean and squared deviations (Chan et al.'s
+    # parallel form of Welford's update)
+    n_b = len(values)
+    mean_b = values.mean()
+    m2_b = ((values - mean_b) ** 2).sum()
+    n = seen + n_b
+    delta = mean_b - acc["mean"]
+    acc["mean"] += delta * n_b / n
+    acc["m2"] += m2_b + delta ** 2 * seen * n_b / n
+    acc["n"] = n
+
+def _finalize_accumulator(acc: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn an accumulator into the statistics dict used by the parser."""
+    return {
+        "min": acc["min"],
+        "max": acc["max"],
+        "mean": float(acc["mean"]),
+        "median": float(np.median(acc["sample"][:acc["filled"]])),
+        "std": float(np.sqrt(acc["m2"] / (acc["n"] - 1))) if acc["n"] > 1 else None,
+    }
+
+def extract_data_streaming(file_path: str, encoding: str = 'utf-8', delimiter: str = ',', header_row: int = 0,
+                           chunksize: int = STREAM_CHUNK_ROWS, preview_rows: int = STREAM_PREVIEW_ROWS,
+                           include_statistics: bool = True) -> Dict[str, Any]:
+    """
+    Extract a row preview and whole-file statistics from a large CSV file.
+    
+    Reads the file in chunks so memory stays bounded by the chunk size.
+    Numeric columns of the first chunk get a running min, max, mean and
+    standard deviation; the median is estimated from a reservoir sample.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        encoding (str): File encoding
+        delimiter (str): CSV delimiter
+        header_row (int): 0-based file line index of the header
+        chunksize (int): Rows per chunk
+        preview_rows (int): Rows kept as a DataFrame for the result
+        include_statistics (bool): Accumulate whole-file statistics; when
+            False only rows are counted
+        
+    Returns:
+        Dict[str, Any]: Columns, the preview DataFrame, total row count
+        and statistics
+    """
+    if not PANDAS_AVAILABLE:
+        return create_result_dict(error="pandas is not available for CSV parsing.")
+    try:
+        reader = pd.read_csv(
+            file_path,
+            encoding=encoding,
+            sep=delimiter,
+            na_filter=True,
+            na_values=[''],  # Empty fields become NaN while tokenizing
+            header=0,
+            skiprows=header_row,
+            chunksize=chunksize,
+        )
+        rng = np.random.default_rng(0)
+        preview = None
+        accumulators = {}
+        total_rows = 0
+        with reader:
+            for chunk in reader:
+                if preview is None:
+                    preview = chunk.head(preview_rows).copy()
+                    if include_statistics:
+                        accumulators = {col: _new_accumulator() for col in chunk.select_dtypes(include=['number']).columns}
+                total_rows += len(chunk)
+                for col, acc in accumulators.items():
+                    # Later chunks may infer a column as text; skip non-numbers
+                    _update_accumulator(acc, pd.to_numeric(chunk[col], errors='coerce'), rng)
+        
+        if preview is None:
+            return create_result_dict(error="Error parsing CSV file: no data rows")
+        
+        logger.info(f"Streamed {total_rows} rows from {file_path}")
+        result = {
+            "columns": preview.columns.tolist(),
+            "dataframe": preview,
+            "shape": (total_rows, preview.shape[1]),
+            "dtypes": {col: str(dtype) for col, dtype in preview.dtypes.items()},
+        }
+        stats = {col: _finalize_accumulator(acc) for col, acc in accumulators.items() if acc["n"]}
+        if stats:
+            result["statistics"] = stats
+        return result
+    except Exception as e:
+        logger.error(f"Error streaming CSV data: {str(e)}")
+        return create_result_dict(error=f"Error parsing CSV file: {str(e)}")
+
+def clean_and_transform_data(data: Dict[str, Any], layout: Optional[str] = "rows") -> Dict[str, Any]:
     """
     Clean and transform the extracted data by handling missing values, duplicates, outliers,
     standardizing headers, and removing NA fields.
@@ -198,6 +634,7 @@ def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         data (Dict[str, Any]): Dictionary with data extracted from CSV
+        layout (str): "rows", "columnar", or None to return only the DataFrame
         
     Returns:
         Dict[str, Any]: Cleaned and transformed data
@@ -207,75 +644,78 @@ def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
         return data
     
     # Skip if no data or columns
-    if not data.get("data") or not data.get("columns"):
+    if not _has_rows(data):
         return data
     
     try:
-        columns = data["columns"]
-        rows = data["data"]
-        
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame(rows, columns=columns)
+        # Reuse the extracted DataFrame when available; the shallow copy
+        # keeps the caller's column labels intact
+        df = _frame_from_data(data).copy(deep=False)
         
         # 1. Standardize column names
         # Convert to lowercase, replace spaces with underscores, remove special characters
-        df.columns = [str(col).lower().strip()
-                      .replace(' ', '_')
-                      .replace('-', '_')
-                      .translate({ord(c): None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'})  # Remove all special chars
-                      for col in df.columns]
+        df.columns = df.columns.astype(str).str.lower().str.strip().str.translate(_CLEAN_TRANS)
         
         standardized_columns = df.columns.tolist()
         
         # 2. Handle missing values
-        # Replace empty strings with NaN for consistent handling
-        df = df.replace('', np.nan)
+        # Replace empty strings with NaN for consistent handling; the
+        # readers already mark empty fields as missing while parsing
+        if "dataframe" not in data:
+            df = df.replace('', np.nan)
         
-        # Drop rows where all values are NaN
-        df = df.dropna(how='all')
+        # Rows that are entirely NaN, columns that are entirely NA (3.) and
+        # duplicate rows (4.) are marked with masks and dropped in a single
+        # selection; a column that is NaN throughout never tells rows apart,
+        # so duplicates can be found before it is removed
+        present = df.notna()
+        keep_rows = present.any(axis=1).to_numpy()
+        keep_columns = present.any(axis=0).to_numpy()
         
-        # 3. Remove columns that are entirely NA
-        df = df.dropna(axis=1, how='all')
+        # 4. Handle duplicates
+        duplicates = df.duplicated().to_numpy() & keep_rows
+        df = df.loc[keep_rows & ~duplicates, keep_columns]
+        if duplicates.any():
+            logger.info(f"Removed {int(duplicates.sum())} duplicate rows from CSV")
         
         # Update columns after column removal
         standardized_columns = df.columns.tolist()
         
-        # 4. Handle duplicates
-        # Remove duplicate rows
-        initial_row_count = len(df)
-        df = df.drop_duplicates()
-        if len(df) < initial_row_count:
-            logger.info(f"Removed {initial_row_count - len(df)} duplicate rows from CSV")
-        
         # 5. Handle outliers for numerical columns
-        numerical_cols = df.select_dtypes(include=['number']).columns
-        for col in numerical_cols:
-            try:
-                # Check if we have enough non-null values to calculate statistics
-                if df[col].count() > 10:  # Arbitrary threshold, adjust as needed
-                    # Calculate Q1, Q3 and IQR
-                    Q1 = df[col].quantile(0.25)
-                    Q3 = df[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    
-                    # Define bounds for outliers
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    # Count outliers
-                    outliers_count = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col].count()
-                    
-                    # Replace outliers with NaN
+        # IQR bounds for every numeric column with enough non-null values
+        # (arbitrary threshold, adjust as needed) in one pass over the
+        # numeric sub-frame; positions keep duplicate names apart
+        try:
+            positions = np.array(_numeric_positions(df), dtype=int)
+            numerical = df.iloc[:, positions]
+            eligible = numerical.count().to_numpy() > 10
+            if eligible.any():
+                positions = positions[eligible]
+                numerical = numerical.iloc[:, eligible]
+                # Quartiles come from the same float64 matrix the mask is
+                # built from; wide frames spread the per-column partitions
+                # over a thread pool
+                values = numerical.to_numpy(dtype='float64', na_value=np.nan)
+                if values.shape[1] >= PARALLEL_MIN_COLUMNS:
+                    with ThreadPoolExecutor(max_workers=min(values.shape[1], os.cpu_count() or 1)) as executor:
+                        Q1, Q3 = np.array(list(executor.map(_column_quartiles, values.T))).T
+                else:
+                    Q1, Q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+                IQR = Q3 - Q1
+                # Replace outliers with NaN
+                with np.errstate(invalid='ignore'):
+                    outliers = (values < Q1 - 1.5 * IQR) | (values > Q3 + 1.5 * IQR)
+                for k, outliers_count in enumerate(outliers.sum(axis=0)):
                     if outliers_count > 0:
-                        df.loc[(df[col] < lower_bound) | (df[col] > upper_bound), col] = np.nan
-                        logger.info(f"Handled {outliers_count} outliers in column '{col}'")
-            except Exception as e:
-                logger.warning(f"Failed to handle outliers in column '{col}': {str(e)}")
+                        df.isetitem(positions[k], df.iloc[:, positions[k]].mask(outliers[:, k]))
+                        logger.info(f"Handled {outliers_count} outliers in column '{df.columns[positions[k]]}'")
+        except Exception as e:
+            logger.warning(f"Failed to handle outliers: {str(e)}")
         
         # Store the cleaned data
         cleaned_data = {
             "columns": standardized_columns,
-            "data": df.values.tolist(),
+            **_frame_payload(df, layout),
             "dataframe": df,  # Store DataFrame for further processing
             "shape": df.shape,
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
@@ -286,12 +726,127 @@ def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(f"Error in clean_and_transform_data: {str(e)}")
         return data
 
-def transform_numerical_data(data: Dict[str, Any]) -> Dict[str, Any]:
+# infer_dtype kinds treated as numerical by transform_numerical_data
+_NUMERIC_KINDS = frozenset({"integer", "floating", "mixed-integer-float", "boolean", "empty"})
+
+def _has_rows(data: Dict[str, Any]) -> bool:
+    """Check whether an intermediate result holds columns and at least one row."""
+    if not data.get("columns"):
+        return False
+    if "dataframe" in data:
+        return not data["dataframe"].empty
+    if "column_data" in data:
+        return any(len(values) for values in data["column_data"].values())
+    return bool(data.get("data"))
+
+def _frame_from_data(data: Dict[str, Any]) -> "pd.DataFrame":
+    """
+    Get the DataFrame behind an intermediate result.
+    
+    Prefers the DataFrame passed along by the previous step, then builds
+    one column-wise from "column_data", and only transposes row lists as
+    a last resort.
+    """
+    if "dataframe" in data:
+        return data["dataframe"]
+    if "column_data" in data:
+        return pd.DataFrame(data["column_data"], columns=data["columns"])
+    return pd.DataFrame(data["data"], columns=data["columns"])
+
+def _numeric_positions(df: "pd.DataFrame") -> List[int]:
+    """Positions of the numeric, non-boolean columns (select_dtypes 'number')."""
+    # Wide frames repeat a handful of dtypes, so each distinct dtype is
+    # classified once; categoricals (never numeric) skip the memo, as
+    # hashing them hashes all their categories
+    numeric = {}
+    positions = []
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+        is_number = numeric.get(dtype)
+        if is_number is None:
+            is_number = numeric[dtype] = (pd.api.types.is_numeric_dtype(dtype)
+                                          and not pd.api.types.is_bool_dtype(dtype))
+        if is_number:
+            positions.append(i)
+    return positions
+
+def _column_quartiles(values: "np.ndarray") -> "np.ndarray":
+    """First and third quartile of a float64 column, ignoring NaN."""
+    return np.nanquantile(values, [0.25, 0.75])
+
+def _numeric_statistics(df: "pd.DataFrame") -> Dict[str, Dict[str, Any]]:
+    """
+    Min, max, mean, median and std of every numeric column.
+    
+    Each column is compacted to its non-null values once and reduced with
+    NumPy; the median uses np.median's partition rather than a full sort.
+    Integer columns keep integral min/max.
+    """
+    stats = {}
+    for index in _numeric_positions(df):
+        values = df.iloc[:, index].dropna().to_numpy()
+        if values.dtype == object:
+            values = values.astype('float64')
+        if not len(values):
+            stats[df.columns[index]] = dict.fromkeys(("min", "max", "mean", "median", "std"))
+            continue
+        stats[df.columns[index]] = {
+            "min": values.min().item(),
+            "max": values.max().item(),
+            "mean": float(values.mean()),
+            "median": float(np.median(values)),
+            "std": float(values.std(ddof=1)) if len(values) > 1 else None
+        }
+    return stats
+
+def _to_native(value: Any) -> Any:
+    """Convert a NumPy/pandas scalar to a native Python value, mapping NaN/NA to None."""
+    if pd.isna(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _coerce_numeric_column(series: "pd.Series") -> Optional["pd.Series"]:
+    """
+    Convert a column holding only numbers to Int64 or float64.
+    
+    infer_dtype reads the dtype of numeric columns and scans object columns
+    in C, so only columns of ints, floats and bools qualify. Returns None
+    for any other column.
+    """
+    # Categoricals only hold text from low_memory_dtypes reads
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return None
+    if pd.api.types.infer_dtype(series, skipna=True) not in _NUMERIC_KINDS:
+        return None
+    try:
+        coerced = pd.to_numeric(series, errors='coerce')
+        # Check if values are integers or floats
+        if (coerced.dropna() % 1 == 0).all():
+            # All values are integers
+            coerced = coerced.astype('Int64')
+        else:
+            # Some values are floats
+            coerced = coerced.astype('float')
+        
+        logger.info(f"Transformed column '{series.name}' to numeric type")
+        return coerced
+    except Exception as e:
+        logger.warning(f"Failed to transform column '{series.name}': {str(e)}")
+        return None
+
+def transform_numerical_data(data: Dict[str, Any], layout: Optional[str] = "rows",
+                             include_statistics: bool = True) -> Dict[str, Any]:
     """
     Transform numerical data in the extracted data to appropriate numeric types.
     
     Args:
         data (Dict[str, Any]): Dictionary with data extracted from CSV
+        layout (str): "rows" for row lists in "data", "columnar" for per-column
+            lists in "column_data"
+        include_statistics (bool): Compute statistics for numerical columns
         
     Returns:
         Dict[str, Any]: Transformed data with proper numeric types
@@ -301,54 +856,32 @@ def transform_numerical_data(data: Dict[str, Any]) -> Dict[str, Any]:
         return data
     
     # Skip if no data or columns
-    if not data.get("data") or not data.get("columns"):
+    if not _has_rows(data):
         return data
     
     try:
         # If a DataFrame is already available, use it
-        if "dataframe" in data:
-            df = data["dataframe"]
+        df = _frame_from_data(data)
+        
+        # Identify and transform numerical columns; the columns are
+        # independent, so wide frames spread them over a thread pool
+        columns = [df.iloc[:, index] for index in range(df.shape[1])]
+        if len(columns) >= PARALLEL_MIN_COLUMNS:
+            with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as executor:
+                coerced_columns = list(executor.map(_coerce_numeric_column, columns))
         else:
-            # Convert to DataFrame
-            df = pd.DataFrame(data["data"], columns=data["columns"])
-        
-        # Identify numerical columns
-        numerical_columns = []
-        for col in df.columns:
-            # Check if column contains numerical data
-            if df[col].dropna().apply(lambda x: isinstance(x, (int, float))).all():
-                numerical_columns.append(col)
-        
-        # Transform numerical columns
-        for col in numerical_columns:
-            try:
-                # Check if values are integers or floats
-                if df[col].dropna().apply(lambda x: float(x) == int(float(x))).all():
-                    # All values are integers
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-                else:
-                    # Some values are floats
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('float')
-                
-                logger.info(f"Transformed column '{col}' to numeric type")
-            except Exception as e:
-                logger.warning(f"Failed to transform column '{col}': {str(e)}")
+            coerced_columns = [_coerce_numeric_column(series) for series in columns]
+        for index, coerced in enumerate(coerced_columns):
+            if coerced is not None:
+                df.isetitem(index, coerced)
         
         # Generate statistics for numerical columns
-        stats = {}
-        for column in df.select_dtypes(include=['number']).columns:
-            stats[column] = {
-                "min": df[column].min(),
-                "max": df[column].max(),
-                "mean": df[column].mean(),
-                "median": df[column].median(),
-                "std": df[column].std()
-            }
+        stats = _numeric_statistics(df) if include_statistics else {}
         
         # Prepare transformed data
         transformed_data = {
             "columns": df.columns.tolist(),
-            "data": df.astype(object).where(pd.notnull(df), None).values.tolist(),
+            **_frame_payload(df, layout),
             "shape": df.shape,
             "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
         }
@@ -361,12 +894,16 @@ def transform_numerical_data(data: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(f"Error in transform_numerical_data: {str(e)}")
         return data
 
-def _parse_csv_internal(file_path: str) -> Dict[str, Any]:
+def _parse_csv_internal(file_path: str, layout: str = "rows", low_memory_dtypes: bool = False,
+                        include_statistics: bool = True) -> Dict[str, Any]:
     """
     Internal function to parse a CSV file.
     
     Args:
         file_path (str): Path to the CSV file
+        layout (str): "rows" or "columnar" result layout
+        low_memory_dtypes (bool): Use compact dtypes while cleaning the data
+        include_statistics (bool): Compute statistics for numerical columns
         
     Returns:
         Dict[str, Any]: Parsed content
@@ -375,17 +912,36 @@ def _parse_csv_internal(file_path: str) -> Dict[str, Any]:
         return create_result_dict(error="pandas is not available for CSV parsing.")
     
     try:
-        # Detect encoding and delimiter
-        encoding = detect_encoding(file_path)
-        delimiter = detect_delimiter(file_path, encoding)
+        filesize = os.path.getsize(file_path)
+        raw = None
+        if filesize <= SNIFF_SAMPLE_SIZE:
+            # Small file: a single read serves detection and parsing,
+            # unless it has grown since the stat
+            raw = _read_head(file_path, SNIFF_SAMPLE_SIZE + 1)
+            if len(raw) > SNIFF_SAMPLE_SIZE:
+                raw = None
+        if raw is not None:
+            encoding, delimiter, header_row = _sniff_dialect_from_bytes(raw, True, file_path)
+        else:
+            # Detect encoding, delimiter and header row in one pass over the file head
+            encoding, delimiter, header_row = _sniff_dialect(file_path)
         
         # Extract data
-        extracted_data = extract_data_with_pandas(file_path, encoding, delimiter)
+        # The intermediate steps hand the DataFrame along; cell values are
+        # only materialized once, in the requested layout, at the end
+        streamed = filesize > STREAMING_THRESHOLD
+        if streamed:
+            extracted_data = extract_data_streaming(file_path, encoding, delimiter, header_row,
+                                                    include_statistics=include_statistics)
+        else:
+            extracted_data = extract_data_with_pandas(file_path, encoding, delimiter, header_row, layout=None,
+                                                     low_memory_dtypes=low_memory_dtypes, raw=raw)
+        del raw
         
         # Add metadata
         metadata = {
             "filename": os.path.basename(file_path),
-            "filesize": os.path.getsize(file_path),
+            "filesize": filesize,
             "encoding": encoding,
             "delimiter": delimiter
         }
@@ -395,14 +951,32 @@ def _parse_csv_internal(file_path: str) -> Dict[str, Any]:
             return extracted_data
         
         # Clean and transform the data
-        cleaned_data = clean_and_transform_data(extracted_data)
+        cleaned_data = clean_and_transform_data(extracted_data, layout=None)
         
         # Transform numerical data
-        transformed_data = transform_numerical_data(cleaned_data)
+        transformed_data = transform_numerical_data(cleaned_data, layout=layout,
+                                                    include_statistics=include_statistics)
         
-        # Remove the DataFrame object before returning
+        # Remove the DataFrame object before returning, materializing it first
+        # if the transformation steps were skipped
         if "dataframe" in transformed_data:
-            del transformed_data["dataframe"]
+            df = transformed_data.pop("dataframe")
+            if "data" not in transformed_data and "column_data" not in transformed_data:
+                transformed_data.update(_frame_payload(df, layout))
+        
+        if streamed:
+            # Cleaning only saw the preview; report the whole file's row
+            # count and statistics under the standardized column names
+            columns = transformed_data["columns"]
+            file_stats = {
+                str(col).lower().strip().translate(_CLEAN_TRANS): col_stats
+                for col, col_stats in extracted_data.get("statistics", {}).items()
+            }
+            transformed_data["shape"] = (extracted_data["shape"][0], len(columns))
+            if include_statistics:
+                transformed_data["statistics"] = {col: file_stats[col] for col in columns if col in file_stats}
+            metadata["streamed"] = True
+            metadata["preview_rows"] = STREAM_PREVIEW_ROWS
         
         # Prepare result
         result = {
@@ -417,24 +991,38 @@ def _parse_csv_internal(file_path: str) -> Dict[str, Any]:
     except Exception as e:
         return create_result_dict(error=f"Error parsing CSV file: {str(e)}")
 
-def parse_csv(file_path: str) -> Dict[str, Any]:
+def parse_csv(file_path: str, layout: str = "rows", low_memory_dtypes: bool = False,
+              include_statistics: bool = True) -> Dict[str, Any]:
     """
     Parse a CSV file and extract data and metadata.
     
     Args:
         file_path (str): Path to the CSV file
+        layout (str): "rows" (default) for row lists in "data", or "columnar"
+            for per-column lists in "column_data"
+        low_memory_dtypes (bool): Use compact dtypes (small ints, float32,
+            categoricals) while reading and cleaning. Categorical and string
+            columns keep their dtype in the reported dtypes; numeric columns
+            are still reported as Int64 or float64 after transformation
+        include_statistics (bool): Compute statistics for numerical columns;
+            pass False when only the data or metadata is needed
         
     Returns:
         Dict[str, Any]: A dictionary containing:
             - metadata (Dict[str, Any]): File metadata
             - columns (List[str]): Column names
-            - data (List[List]): Row data
+            - data (List[List]): Row data (rows layout); files larger than
+              STREAMING_THRESHOLD return the first STREAM_PREVIEW_ROWS rows
+              and set metadata["streamed"]
+            - column_data (Dict[str, List]): Values per column (columnar layout)
             - shape (Tuple[int, int]): DataFrame shape
             - dtypes (Dict[str, str]): Data types of columns
-            - statistics (Dict): Statistics for numerical columns (if any)
+            - statistics (Dict): Statistics for numerical columns (if any and
+              include_statistics)
             - error (str): Error message (if any)
     """
-    return safe_parse(_parse_csv_internal, file_path)
+    return safe_parse(_parse_csv_internal, file_path, layout=layout,
+                      low_memory_dtypes=low_memory_dtypes, include_statistics=include_statistics)
 
 # Example usage
 if __name__ == "__main__":
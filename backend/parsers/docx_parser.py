@@ -1,93 +1,250 @@
 import os
+import copy
 import logging
-from typing import Dict, List, Any
+import zipfile
+import functools
+from typing import Dict, List, Any, Iterator
+from lxml import etree
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_Merge
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Headings recognised by name in ESG questionnaires, and placeholders that
+# look like headings but are not
+COMMON_HEADINGS = frozenset({"Personas", "Gobierno", "Seguridad", "Cultura", "Medios de vida", "Infraestructura", "Medio ambiente", "Tierra y recursos naturales"})
+INVALID_HEADINGS = frozenset({"N/C", "N/S", "Completar con:"})
+
+# Run content elements and the text python-docx gives them; <w:br> depends
+# on its break type and <w:t> on its content, so both are handled inline
+_RUN_TEXT = {qn('w:tab'): "\t", qn('w:ptab'): "\t", qn('w:cr'): "\n", qn('w:noBreakHyphen'): "-"}
+_W_BODY, _W_P, _W_R, _W_T, _W_BR = qn('w:body'), qn('w:p'), qn('w:r'), qn('w:t'), qn('w:br')
+_W_HYPERLINK, _W_BR_TYPE = qn('w:hyperlink'), qn('w:type')
+
+def _heading_styles(doc: Document) -> Dict[str, bool]:
+    """Map paragraph style ids to whether they are heading styles, with the default style under None."""
+    names = {}
+    for style in doc.styles:
+        # The first definition of an id wins, as in python-docx's own lookup
+        names.setdefault(style.style_id, style.name if style.type == WD_STYLE_TYPE.PARAGRAPH else None)
+    default = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_name = default.name if default is not None else None
+    names = {style_id: name if name is not None else default_name for style_id, name in names.items()}
+    names[None] = default_name
+    return {style_id: name is not None and 'Heading' in name for style_id, name in names.items()}
+
+def _scan_paragraphs(doc: Document) -> Dict[str, Any]:
+    """Collect text, sections and word count from one walk over the paragraphs."""
+    # Read the body's <w:p> elements directly rather than through Paragraph
+    # proxies, testing heading styles against a table built once per document
+    heading_styles = _heading_styles(doc)
+    default_heading = heading_styles[None]
+    lines, sections = [], []
+    current_section, current_content = None, []
+    paragraph_count = word_count = 0
+    
+    for p in doc.element.body.iterchildren(qn('w:p')):
+        paragraph_count += 1
+        raw = _paragraph_text(p)
+        word_count += len(raw.split())
+        text = raw.strip()
+        if not text:
+            continue
+        lines.append(text)
+        
+        if text.isupper() or text.endswith(":") or text in COMMON_HEADINGS:
+            is_heading = True
+        else:
+            is_heading = heading_styles.get(p.style or None, default_heading)
+        if is_heading and text not in INVALID_HEADINGS:
+            if current_section and current_content:
+                sections.append({"heading": current_section, "content": "\n".join(current_content)})
+            current_section, current_content = text, []
+        else:
+            current_content.append(text)
+    
+    if current_section and current_content:
+        sections.append({"heading": current_section, "content": "\n".join(current_content)})
+    return {
+        "text": "\n".join(lines),
+        "sections": sections,
+        "paragraphs": lines,
+        "paragraph_count": paragraph_count,
+        "word_count": word_count,
+    }
+
+def _run_text(run) -> str:
+    """Text of a <w:r> element, as python-docx's Run.text renders it."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(_W_BR_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return "".join(parts)
+
+def _paragraph_text(p) -> str:
+    """
+    Text of a <w:p> element from its runs and hyperlink runs, as
+    Paragraph.text renders it.
+    
+    Built from the run children rather than CT_P.text, which only exists
+    from python-docx 1.0; on older versions .text is lxml's (empty) text.
+    """
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _W_R)
+    return "".join(parts)
+
+def _iter_body_paragraph_text(file_path: str) -> Iterator[str]:
+    """
+    Stream the text of each top-level body paragraph from word/document.xml.
+    
+    Matches doc.paragraphs / Paragraph.text (runs and hyperlink runs only;
+    table cell paragraphs excluded) without building python-docx objects.
+    Processed elements are cleared so memory stays flat on large files.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open('word/document.xml') as xml_file:
+            for _, para in etree.iterparse(xml_file, events=('end',), tag=_W_P):
+                parent = para.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+                yield _paragraph_text(para)
+                # Drop this paragraph and everything before it in the body
+                para.clear()
+                while para.getprevious() is not None:
+                    del parent[0]
+
 def extract_text_from_docx(file_path: str) -> str:
     """Extract full text from a DOCX file, cleaning up unnecessary whitespace."""
     try:
-        doc = Document(file_path)
-        return "\n".join(filter(None, (para.text.strip() for para in doc.paragraphs)))
+        try:
+            return "\n".join(filter(None, (text.strip() for text in _iter_body_paragraph_text(file_path))))
+        except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
+            # Not a plain WordprocessingML package; let python-docx decide
+            logger.info(f"Streaming text extraction failed, using python-docx: {str(e)}")
+        return _scan_paragraphs(Document(file_path))["text"]
 
     except Exception as e:
         logger.error(f"Error extracting text from DOCX: {str(e)}")
         return ""
 
-def extract_tables_with_context(doc: Document) -> List[Dict[str, Any]]:
+def _table_rows(tbl) -> List[List[str]]:
+    """
+    Stripped cell text per row of a <w:tbl> element, laid out like row.cells.
+    
+    python-docx rebuilds the whole cell grid for every row.cells access and
+    wraps each cell and paragraph; here the grid is built once and merged
+    cells reuse the text of the cell they continue.
+    """
+    col_count = tbl.col_count
+    row_count = len(tbl.tr_lst)
+    if not col_count:
+        return [[] for _ in range(row_count)]
+    cells = []
+    for tc in tbl.iter_tcs():
+        for span_index in range(tc.grid_span):
+            if tc.vMerge == ST_Merge.CONTINUE:
+                cells.append(cells[-col_count])
+            elif span_index > 0:
+                cells.append(cells[-1])
+            else:
+                cells.append("\n".join(_paragraph_text(p) for p in tc.p_lst).strip())
+    return [cells[start:start + col_count] for start in range(0, row_count * col_count, col_count)]
+
+def extract_tables_with_context(doc: Document, paragraphs: List[str] = None) -> List[Dict[str, Any]]:
     """Extract tables with preceding paragraph as title where possible."""
     tables_data = []
-    paragraphs = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+    if paragraphs is None:
+        paragraphs = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
     
     for i, table in enumerate(doc.tables):
         prev_title = paragraphs[i - 1] if i > 0 and i - 1 < len(paragraphs) else f"Table {i + 1}"
-        table_content = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+        table_content = _table_rows(table._tbl)
         tables_data.append({"title": prev_title, "content": table_content})
     return tables_data
 
+def _metadata_from_doc(doc: Document, file_path: str, scan: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the metadata dict for an already-loaded document."""
+    metadata = {
+        "filename": os.path.basename(file_path),
+        "filesize": os.path.getsize(file_path),
+        "paragraphs": scan["paragraph_count"],
+        "tables": len(doc.tables),
+        "word_count": scan["word_count"],
+        "page_count": len(doc.sections),
+    }
+    try:
+        # Each core property is parsed from the XML on access, so read once
+        core_props = doc.core_properties
+        created, modified = core_props.created, core_props.modified
+        metadata.update({
+            "author": core_props.author or "Not available",
+            "title": core_props.title or "Not available",
+            "created": created.isoformat() if created else "Not available",
+            "modified": modified.isoformat() if modified else "Not available",
+            "last_modified_by": core_props.last_modified_by or "Not available",
+            "revision": core_props.revision or "Not available"
+        })
+    except Exception as e:
+        logger.warning(f"Error extracting core properties: {str(e)}")
+    return metadata
+
 def extract_metadata_from_docx(file_path: str) -> Dict[str, Any]:
     """Extract metadata including author, file size, and document statistics."""
 
     try:
         doc = Document(file_path)
-        metadata = {
-            "filename": os.path.basename(file_path),
-            "filesize": os.path.getsize(file_path),
-            "paragraphs": len(doc.paragraphs),
-            "tables": len(doc.tables),
-            "word_count": sum(len(p.text.split()) for p in doc.paragraphs),
-            "page_count": len(doc.sections),
-        }
-        try:
-            core_props = doc.core_properties
-            metadata.update({
-                "author": core_props.author or "Not available",
-                "title": core_props.title or "Not available",
-                "created": core_props.created.isoformat() if core_props.created else "Not available",
-                "modified": core_props.modified.isoformat() if core_props.modified else "Not available",
-                "last_modified_by": core_props.last_modified_by or "Not available",
-                "revision": core_props.revision or "Not available"
-            })
-        except Exception as e:
-            logger.warning(f"Error extracting core properties: {str(e)}")
-        return metadata
+        return _metadata_from_doc(doc, file_path, _scan_paragraphs(doc))
     except Exception as e:
         logger.error(f"Error extracting metadata from DOCX: {str(e)}")
         return {}
 
 def extract_sections_from_docx(file_path: str) -> List[Dict[str, Any]]:
     """Extract structured sections from a DOCX document."""
-    doc = Document(file_path)
-    sections, current_section, current_content = [], None, []
-    common_headings = {"Personas", "Gobierno", "Seguridad", "Cultura", "Medios de vida", "Infraestructura", "Medio ambiente", "Tierra y recursos naturales"}
-    invalid_headings = {"N/C", "N/S", "Completar con:"}  # exclude these headings
-    
-    for para in doc.paragraphs:
-        text = para.text.strip()
-        if not text:
-            continue
-        
-        is_heading = (para.style and 'Heading' in para.style.name) or text.isupper() or text.endswith(":") or text in common_headings
-        if is_heading and text not in invalid_headings:
-            if current_section and current_content:
-                sections.append({"heading": current_section, "content": "\n".join(current_content)})
-            current_section, current_content = text, []
-        else:
-            current_content.append(text)
-    
-    if current_section and current_content:
-        sections.append({"heading": current_section, "content": "\n".join(current_content)})
-    return sections
+    return _scan_paragraphs(Document(file_path))["sections"]
 
-def parse_docx(file_path: str) -> Dict[str, Any]:
-    """Parse DOCX file into structured metadata, text, sections, and tables."""
+@functools.lru_cache(maxsize=64)
+def _parse_docx_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a DOCX once per (path, mtime, size); the stat fields only key the cache."""
+    # Load the document once and share a single paragraph walk across
+    # the text, section and metadata extraction
     doc = Document(file_path)
+    scan = _scan_paragraphs(doc)
+    try:
+        metadata = _metadata_from_doc(doc, file_path, scan)
+    except Exception as e:
+        logger.error(f"Error extracting metadata from DOCX: {str(e)}")
+        metadata = {}
     return {
-        "metadata": extract_metadata_from_docx(file_path),
-        "text": extract_text_from_docx(file_path),
-        "sections": extract_sections_from_docx(file_path),
-        "tables": extract_tables_with_context(doc)
+        "metadata": metadata,
+        "text": scan["text"],
+        "sections": scan["sections"],
+        "tables": extract_tables_with_context(doc, scan["paragraphs"])
     }
+
+def parse_docx(file_path: str) -> Dict[str, Any]:
+    """
+    Parse DOCX file into structured metadata, text, sections, and tables.
+    
+    Results are cached per (path, mtime, size), so repeated calls on an
+    unchanged file skip the parse; parse_docx.cache_clear() empties the cache.
+    """
+    stat = os.stat(file_path)
+    result = _parse_docx_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    # Deep copy so callers mutating sections or tables cannot change what
+    # the next caller gets from the cache
+    return copy.deepcopy(result)
+
+parse_docx.cache_clear = _parse_docx_cached.cache_clear
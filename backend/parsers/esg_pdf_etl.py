@@ -16,6 +16,7 @@ import logging
 import time
 from typing import Dict, Any
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Import refactored modules
 from parsers.pdf_parser.extraction import extract_from_pdf, check_file_exists, get_file_extension, is_supported_pdf
@@ -25,12 +26,8 @@ from parsers.pdf_parser.metadata import extract_document_metadata
 from parsers.pdf_parser.section_hierarchy import build_section_hierarchy
 from parsers.pdf_parser.chunk_enrichment import enrich_chunks_with_metadata
 from parsers.utils.structure_utils import detect_headers
+from parsers import init_worker_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 def run_etl_pipeline(pdf_path: str, output_dir: str, **kwargs) -> Dict[str, Any]:
@@ -38,15 +35,10 @@ def run_etl_pipeline(pdf_path: str, output_dir: str, **kwargs) -> Dict[str, Any]
     if not is_supported_pdf(pdf_path):
         raise ValueError(f"Unsupported file format: {pdf_path}")
     
-    # Create directory structure
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    filename = os.path.basename(pdf_path).split(".")[0]
-    document_dir = os.path.join(output_dir, filename)
-    os.makedirs(document_dir, exist_ok=True)
+    # Create directory structure; makedirs creates every missing parent
+    filename = os.path.splitext(os.path.basename(pdf_path))[0]
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    timestamped_dir = os.path.join(document_dir, timestamp)
-    os.makedirs(timestamped_dir, exist_ok=True)
+    timestamped_dir = os.path.join(output_dir, filename, timestamp)
     images_dir = os.path.join(timestamped_dir, "images")
     os.makedirs(images_dir, exist_ok=True)
     
@@ -72,15 +64,20 @@ def run_etl_pipeline(pdf_path: str, output_dir: str, **kwargs) -> Dict[str, Any]
     # Add this line to detect headers if they're not already in transformed_data
     if "headers" not in transformed_data:
         text = extracted_data["text"][extracted_data["metadata"]["best_text_extractor"]]
-        transformed_data["headers"] = detect_headers(
-            "\n".join([text[i] for i in sorted(text.keys())]), 
-            extracted_data["text"][extracted_data["metadata"]["best_text_extractor"]]
-        )
+        # Pass the pages in order rather than joining them into one string
+        transformed_data["headers"] = detect_headers([text[i] for i in sorted(text)], text)
     
-    # Loading phase - Fix the parameter order here
-    loading_start = time.time()
-    output_result = load_chunks(extracted_data, transformed_data, timestamped_dir, pdf_path)
-    loading_time = time.time() - loading_start
+    # Loading phase - Fix the parameter order here. The section hierarchy and
+    # document metadata depend only on the transformed headers and the PDF,
+    # so they are built in background threads while the chunks are written
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hierarchy_future = executor.submit(build_section_hierarchy, transformed_data.get("headers", []))
+        metadata_future = executor.submit(extract_document_metadata, pdf_path)
+        loading_start = time.time()
+        output_result = load_chunks(extracted_data, transformed_data, timestamped_dir, pdf_path, source_name=filename)
+        loading_time = time.time() - loading_start
+        section_hierarchy = hierarchy_future.result()
+        doc_metadata = metadata_future.result()
     
     # Calculate total processing time
     total_time = extraction_time + transformation_time + loading_time
@@ -92,12 +89,6 @@ def run_etl_pipeline(pdf_path: str, output_dir: str, **kwargs) -> Dict[str, Any]
     result["loading_time"] = loading_time
     result["processing_time"] = total_time
     
-    # Build section hierarchy
-    section_hierarchy = build_section_hierarchy(transformed_data.get("headers", []))
-    
-    # Get extended document metadata
-    doc_metadata = extract_document_metadata(pdf_path)
-    
     # After chunks are created but before saving
     # Use the chunks from transformed_data since result might not have them yet
     if "chunks" in transformed_data:
@@ -107,16 +98,49 @@ def run_etl_pipeline(pdf_path: str, output_dir: str, **kwargs) -> Dict[str, Any]
     
     return result
 
-def process_directory(input_dir: str, output_dir: str) -> Dict[str, Any]:
-    """Process all PDF files in a directory."""
+def _failed_result(pdf_path: str, output_dir: str, error: Exception) -> Dict[str, Any]:
+    """Result entry for a file whose pipeline run raised."""
+    logger.error(f"Failed to process {pdf_path}: {str(error)}")
+    return {"file_path": pdf_path, "output_dir": output_dir, "status": "error", "error": str(error)}
+
+def process_directory(input_dir: str, output_dir: str, max_workers: int = None) -> Dict[str, Any]:
+    """
+    Process all PDF files in a directory.
+    
+    Files are independent and their extraction is CPU-bound, so several are
+    run at once in worker processes (up to max_workers, default the CPU
+    count). A file that fails is reported with status "error" without
+    stopping the others.
+    """
     logger.info(f"Processing all PDFs in {input_dir}")
     os.makedirs(output_dir, exist_ok=True)
-    results = {}
     pdf_files = [f for f in os.listdir(input_dir) if f.lower().endswith(".pdf")]
-    for pdf_file in pdf_files:
-        pdf_path = os.path.join(input_dir, pdf_file)
-        result = run_etl_pipeline(pdf_path, output_dir)
-        results[pdf_file] = result
+    pdf_paths = {pdf_file: os.path.join(input_dir, pdf_file) for pdf_file in pdf_files}
+    workers = min(len(pdf_files), max_workers or os.cpu_count() or 1)
+    completed = {}
+    if workers < 2:
+        for pdf_file, pdf_path in pdf_paths.items():
+            try:
+                completed[pdf_file] = run_etl_pipeline(pdf_path, output_dir)
+            except Exception as e:
+                completed[pdf_file] = _failed_result(pdf_path, output_dir, e)
+    else:
+        # Workers configure their own logging at the parent's level, as
+        # spawned processes do not inherit its handlers
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_logging,
+                                 initargs=(logging.getLogger().getEffectiveLevel(),)) as executor:
+            futures = {
+                executor.submit(run_etl_pipeline, pdf_path, output_dir): pdf_file
+                for pdf_file, pdf_path in pdf_paths.items()
+            }
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    completed[pdf_file] = future.result()
+                except Exception as e:
+                    completed[pdf_file] = _failed_result(pdf_paths[pdf_file], output_dir, e)
+    # Report files in directory order regardless of completion order
+    results = {pdf_file: completed[pdf_file] for pdf_file in pdf_files}
     summary = {
         "total_files": len(pdf_files),
         "successful": sum(1 for r in results.values() if r["status"] == "success"),
@@ -128,6 +152,11 @@ def process_directory(input_dir: str, output_dir: str) -> Dict[str, Any]:
     return summary
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     if len(sys.argv) > 2:
         input_path = sys.argv[1]
         output_dir = sys.argv[2]
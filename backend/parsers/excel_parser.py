@@ -23,13 +23,14 @@ and returns the data in a structured format.
 
 import os
 import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Union, Tuple
 
 # Import utility functions
 from .utils import safe_parse, create_result_dict
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Try to import the required libraries
@@ -48,34 +49,96 @@ except ImportError:
     OPENPYXL_AVAILABLE = False
     logger.warning("openpyxl not available. Complex Excel parsing will be limited.")
 
-def extract_data_with_pandas(file_path: str) -> Dict[str, Any]:
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Prefer the native calamine reader when installed; otherwise let pandas
+# pick its default engine for the file type
+_PANDAS_ENGINE = "calamine" if CALAMINE_AVAILABLE else None
+
+# Column name standardization: spaces and hyphens become underscores and
+# special characters are dropped
+_CLEAN_TRANS = str.maketrans({' ': '_', '-': '_', **{c: None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'}})
+
+# pandas.api.types.infer_dtype results for columns holding only numbers
+_NUMERIC_KINDS = frozenset({"integer", "floating", "mixed-integer-float", "boolean", "empty"})
+
+# Leading rows inspected first when classifying a column; any non-numeric
+# value among them rules the column out without scanning the rest
+_INFERENCE_SAMPLE = 2000
+
+# Workbooks with at least this many sheets clean and convert them on a
+# thread pool; sheets are independent until the final merge step
+PARALLEL_MIN_SHEETS = 4
+
+def _frame_rows(df: "pd.DataFrame", missing_as_none: bool = False) -> List[List[Any]]:
+    """
+    Convert a DataFrame to row lists one column at a time.
+    
+    Unlike df.values.tolist() this never interleaves the frame into a single
+    object (or upcast float) array first. With missing_as_none, NaN/NA
+    become None.
+    """
+    column_lists = []
+    for index in range(df.shape[1]):
+        series = df.iloc[:, index]
+        if missing_as_none and series.hasnans:
+            series = series.astype(object).where(series.notna(), None)
+        column_lists.append(series.tolist())
+    if not column_lists:
+        return [[] for _ in range(len(df))]
+    return [list(row) for row in zip(*column_lists)]
+
+def extract_data_with_pandas(file_path: str, columnar: bool = False, keep_dataframes: bool = False) -> Dict[str, Any]:
     """
     Extract data from an Excel file using pandas.
     
     Args:
         file_path (str): Path to the Excel file
+        columnar (bool): Return each sheet's values as a "columns" mapping of
+            header to NumPy array instead of row lists under "data"
+        keep_dataframes (bool): Return each sheet as a "dataframe" instead,
+            for the cleaning and transformation steps to use directly
         
     Returns:
-        Dict[str, Any]: Dictionary with sheet names as keys and DataFrames as values
+        Dict[str, Any]: Dictionary with sheet names as keys and sheet data as values
     """
     if not PANDAS_AVAILABLE:
         return {}
     
     try:
-        # Read all sheets
-        excel_file = pd.ExcelFile(file_path)
-        sheet_names = excel_file.sheet_names
+        # Read all sheets in one pass
+        sheets = pd.read_excel(file_path, sheet_name=None, engine=_PANDAS_ENGINE)
         
         result = {}
-        for sheet_name in sheet_names:
-            # Read sheet into DataFrame
-            df = excel_file.parse(sheet_name)
-            
-            # Convert DataFrame to dict
-            sheet_data = {
-                "headers": df.columns.tolist(),
-                "data": df.values.tolist()
-            }
+        for sheet_name, df in sheets.items():
+            headers = df.columns.tolist()
+            if keep_dataframes:
+                sheet_data = {
+                    "headers": headers,
+                    "dataframe": df
+                }
+            elif columnar:
+                # Keep typed column arrays; no Python object per cell
+                sheet_data = {
+                    "headers": headers,
+                    "columns": {header: df.iloc[:, index].to_numpy() for index, header in enumerate(headers)}
+                }
+            else:
+                # Convert DataFrame to dict
+                sheet_data = {
+                    "headers": headers,
+                    "data": _frame_rows(df)
+                }
             
             result[sheet_name] = sheet_data
             
@@ -98,39 +161,68 @@ def extract_data_with_openpyxl(file_path: str) -> Dict[str, Any]:
         return {}
     
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
-        sheet_names = workbook.sheetnames
-        
-        result = {}
-        for sheet_name in sheet_names:
-            sheet = workbook[sheet_name]
-            
-            # Get header row (assume first row is header)
-            headers = []
-            for cell in sheet[1]:
-                headers.append(str(cell.value) if cell.value is not None else "")
-            
-            # Get data rows
-            data = []
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                data.append(list(row))
+        # Read-only mode streams rows from the sheet XML instead of building
+        # a styled Cell object for every cell
+        workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
+        try:
+            result = {}
+            for sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+                # The stored dimension can be missing or bogus (e.g.
+                # A1:XFD1048576), and read-only rows are padded to it; size
+                # the sheet from the cells actually present instead
+                sheet.reset_dimensions()
+                rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+                
+                # Rows without any cells (formatting only) after the last
+                # cell do not count towards the sheet, as in regular mode
+                while rows and not rows[-1]:
+                    rows.pop()
+                
+                # Streamed rows stop at their last cell; pad them to the
+                # sheet width as the regular (non read-only) worksheet does
+                width = max((len(row) for row in rows), default=0) or 1
+                for row in rows:
+                    if len(row) < width:
+                        row.extend([None] * (width - len(row)))
+                
+                # Get header row (assume first row is header)
+                headers = [str(value) if value is not None else "" for value in (rows[0] if rows else [None] * width)]
+                
+                # Get data rows
+                data = rows[1:]
+                
+                result[sheet_name] = {
+                    "headers": headers,
+                    "data": data
+                }
             
-            result[sheet_name] = {
-                "headers": headers,
-                "data": data
-            }
-        
-        return result
+            return result
+        finally:
+            workbook.close()
     except Exception as e:
         logger.error(f"Error extracting data with openpyxl: {str(e)}")
         return {}
 
-def extract_metadata(file_path: str) -> Dict[str, Any]:
+def _xlsx_sheet_names(file_path: str) -> List[str]:
+    """
+    Read sheet names straight from xl/workbook.xml of an xlsx/xlsm package.
+    
+    Much cheaper than opening the workbook, since no sheet or style parts are
+    parsed. Raises for files that are not Office Open XML workbooks.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        root = etree.fromstring(archive.read('xl/workbook.xml'))
+    return [element.get('name') for element in root.iter('{*}sheet')]
+
+def extract_metadata(file_path: str, sheet_names: List[str] = None) -> Dict[str, Any]:
     """
     Extract metadata from an Excel file.
     
     Args:
         file_path (str): Path to the Excel file
+        sheet_names (List[str], optional): Sheet names already known to the
+            caller, to avoid opening the workbook again
         
     Returns:
         Dict[str, Any]: Metadata dictionary
@@ -141,9 +233,15 @@ def extract_metadata(file_path: str) -> Dict[str, Any]:
     }
     
     # Try to get sheet names
-    sheet_names = []
+    sheet_names = list(sheet_names) if sheet_names else []
     
-    if PANDAS_AVAILABLE:
+    if not sheet_names and LXML_AVAILABLE:
+        try:
+            sheet_names = _xlsx_sheet_names(file_path)
+        except Exception:
+            pass
+    
+    if not sheet_names and PANDAS_AVAILABLE:
         try:
             excel_file = pd.ExcelFile(file_path)
             sheet_names = excel_file.sheet_names
@@ -152,8 +250,11 @@ def extract_metadata(file_path: str) -> Dict[str, Any]:
     
     if not sheet_names and OPENPYXL_AVAILABLE:
         try:
-            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            # Only the sheet list is needed: skip external links and release
+            # the read-only workbook's file handle straight away
+            workbook = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
             sheet_names = workbook.sheetnames
+            workbook.close()
         except Exception:
             pass
     
@@ -163,137 +264,141 @@ def extract_metadata(file_path: str) -> Dict[str, Any]:
     
     return metadata
 
-def transform_numerical_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Transform numerical data in the extracted sheets to appropriate numeric types.
+def _map_sheets(func, sheets_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply func(sheet_name, sheet_content) to every sheet, keeping sheet order."""
+    workers = min(len(sheets_data), os.cpu_count() or 1)
+    if len(sheets_data) < PARALLEL_MIN_SHEETS or workers < 2:
+        return {sheet_name: func(sheet_name, sheet_content) for sheet_name, sheet_content in sheets_data.items()}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(sheets_data, executor.map(func, sheets_data, sheets_data.values())))
+
+def _transform_sheet(sheet_name: str, sheet_content: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the numeric columns of one sheet; see transform_numerical_data."""
+    # Get headers from current sheet data before centralization
+    headers = sheet_content["headers"]  # Direct access from sheet content
     
-    Args:
-        sheets_data (Dict[str, Any]): Dictionary with sheet data extracted from Excel
+    # If a DataFrame is already available, use it
+    if "dataframe" in sheet_content:
+        df = sheet_content["dataframe"]
         
-    Returns:
-        Dict[str, Any]: Transformed sheet data with proper numeric types
-    """
-    if not PANDAS_AVAILABLE:
-        logger.warning("Pandas not available. Skipping numerical data transformation.")
-        return sheets_data
-    
-    transformed_sheets = {}
-    
-    for sheet_name, sheet_content in sheets_data.items():
-        # Get headers from current sheet data before centralization
-        headers = sheet_content["headers"]  # Direct access from sheet content
+        # Skip empty sheets
+        if df.empty or not headers:
+            return {**sheet_content, "data": _frame_rows(df)}
+    else:
         data = sheet_content["data"]
         
         # Skip empty sheets
         if not data or not headers:
-            transformed_sheets[sheet_name] = sheet_content
-            continue
+            return sheet_content
         
-        # If a DataFrame is already available, use it
-        if "dataframe" in sheet_content:
-            df = sheet_content["dataframe"]
-        else:
-            # Validate and align headers and data
-            max_data_columns = max([len(row) for row in data]) if data else 0
-            header_count = len(headers)
-            
-            if header_count != max_data_columns:
-                logger.warning(f"Column count mismatch in sheet '{sheet_name}': {header_count} headers vs {max_data_columns} data columns")
-                
-                if header_count > max_data_columns:
-                    # Trim extra headers
-                    logger.info(f"Trimming headers from {header_count} to {max_data_columns} columns")
-                    headers = headers[:max_data_columns]
-                else:
-                    # Extend headers with placeholder names
-                    logger.info(f"Extending headers from {header_count} to {max_data_columns} columns")
-                    headers.extend([f"column_{i+1}" for i in range(header_count, max_data_columns)])
-            
-            # Ensure all data rows have the same number of columns
-            normalized_data = []
-            for row in data:
-                if len(row) < len(headers):
-                    # Pad missing values with None
-                    normalized_data.append(row + [None] * (len(headers) - len(row)))
-                else:
-                    # Trim extra values
-                    normalized_data.append(row[:len(headers)])
-            
-            # Convert to DataFrame for easier processing
-            try:
-                df = pd.DataFrame(normalized_data, columns=headers)
-            except Exception as e:
-                logger.error(f"Error creating DataFrame for sheet '{sheet_name}': {str(e)}")
-                transformed_sheets[sheet_name] = sheet_content
-                continue
-        
-        # Identify numerical columns
-        numerical_columns = []
-        for col in df.columns:
-            # Check if column contains numerical data
-            if df[col].dropna().apply(lambda x: isinstance(x, (int, float))).all():
-                numerical_columns.append(col)
+        # Validate and align headers and data
+        max_data_columns = max([len(row) for row in data]) if data else 0
+        header_count = len(headers)
         
-        # Transform numerical columns
-        for col in numerical_columns:
-            try:
-                # Check if values are integers or floats
-                if df[col].dropna().apply(lambda x: float(x) == int(float(x))).all():
-                    # All values are integers
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-                else:
-                    # Some values are floats
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('float')
-                
-                logger.info(f"Transformed column '{col}' in sheet '{sheet_name}' to numeric type")
-            except Exception as e:
-                logger.warning(f"Failed to transform column '{col}' in sheet '{sheet_name}': {str(e)}")
+        if header_count != max_data_columns:
+            logger.warning(f"Column count mismatch in sheet '{sheet_name}': {header_count} headers vs {max_data_columns} data columns")
+            
+            if header_count > max_data_columns:
+                # Trim extra headers
+                logger.info(f"Trimming headers from {header_count} to {max_data_columns} columns")
+                headers = headers[:max_data_columns]
+            else:
+                # Extend headers with placeholder names
+                logger.info(f"Extending headers from {header_count} to {max_data_columns} columns")
+                headers.extend([f"column_{i+1}" for i in range(header_count, max_data_columns)])
         
-        # Keep headers in transformed data for final aggregation
-        transformed_sheets[sheet_name] = {
-            "headers": headers,  # Maintain temporarily for final aggregation
-            "data": df.astype(object).where(pd.notnull(df), None).values.tolist()
-        }
+        # Ensure all data rows have the same number of columns
+        normalized_data = []
+        for row in data:
+            if len(row) < len(headers):
+                # Pad missing values with None
+                normalized_data.append(row + [None] * (len(headers) - len(row)))
+            else:
+                # Trim extra values
+                normalized_data.append(row[:len(headers)])
         
-        # Keep the dataframe if it was in the original content
-        if "dataframe" in sheet_content:
-            transformed_sheets[sheet_name]["dataframe"] = df
+        # Convert to DataFrame for easier processing
+        try:
+            df = pd.DataFrame(normalized_data, columns=headers)
+        except Exception as e:
+            logger.error(f"Error creating DataFrame for sheet '{sheet_name}': {str(e)}")
+            return sheet_content
     
-    return transformed_sheets
+    # Identify and transform numerical columns
+    # infer_dtype scans each column in C, so only columns of ints,
+    # floats and bools qualify. Text columns are usually rejected from the
+    # sample alone; only a numeric-looking sample needs the full scan
+    for index, col in enumerate(df.columns):
+        series = df.iloc[:, index]
+        if pd.api.types.infer_dtype(series.iloc[:_INFERENCE_SAMPLE], skipna=True) not in _NUMERIC_KINDS:
+            continue
+        if len(series) > _INFERENCE_SAMPLE and pd.api.types.infer_dtype(series, skipna=True) not in _NUMERIC_KINDS:
+            continue
+        try:
+            if pd.api.types.is_integer_dtype(series.dtype):
+                # Already an integer dtype: nothing to coerce or check
+                coerced, is_integral = series, True
+            else:
+                coerced = pd.to_numeric(series, errors='coerce')
+                is_integral = (coerced.dropna() % 1 == 0).all()
+            # Check if values are integers or floats
+            if is_integral:
+                # All values are integers
+                df.isetitem(index, coerced.astype('Int64'))
+            else:
+                # Some values are floats
+                df.isetitem(index, coerced.astype('float'))
+            
+            logger.info(f"Transformed column '{col}' in sheet '{sheet_name}' to numeric type")
+        except Exception as e:
+            logger.warning(f"Failed to transform column '{col}' in sheet '{sheet_name}': {str(e)}")
+    
+    # Keep headers in transformed data for final aggregation
+    transformed = {
+        "headers": headers,  # Maintain temporarily for final aggregation
+        "data": _frame_rows(df, missing_as_none=True)
+    }
+    
+    # Keep the dataframe if it was in the original content
+    if "dataframe" in sheet_content:
+        transformed["dataframe"] = df
+    return transformed
 
-def clean_and_transform_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
+def transform_numerical_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Clean and transform the extracted data by handling missing values, duplicates, outliers,
-    standardizing headers, and removing NA fields.
-    
-    This function performs the following transformations:
-    1. Standardizes column names (lowercase, spaces to underscores)
-    2. Handles missing values by dropping rows that are entirely empty
-    3. Removes columns that are entirely NA
-    4. Removes duplicate rows
-    5. Handles outliers in numerical columns using IQR method
-    6. Merges sheets with identical schemas (if applicable)
+    Transform numerical data in the extracted sheets to appropriate numeric types.
     
     Args:
         sheets_data (Dict[str, Any]): Dictionary with sheet data extracted from Excel
         
     Returns:
-        Dict[str, Any]: Cleaned and transformed sheet data
+        Dict[str, Any]: Transformed sheet data with proper numeric types
     """
     if not PANDAS_AVAILABLE:
-        logger.warning("Pandas not available. Skipping data cleaning and transformation.")
+        logger.warning("Pandas not available. Skipping numerical data transformation.")
         return sheets_data
     
-    cleaned_sheets = {}
+    return _map_sheets(_transform_sheet, sheets_data)
+
+def _clean_sheet(sheet_name: str, sheet_content: Dict[str, Any]) -> Dict[str, Any]:
+    """Clean one sheet (steps 1-5 of clean_and_transform_data)."""
+    headers = sheet_content["headers"]
     
-    for sheet_name, sheet_content in sheets_data.items():
-        headers = sheet_content["headers"]
+    if "dataframe" in sheet_content:
+        # Sheets extracted as DataFrames are used as-is, without a
+        # round trip through row lists
+        source_df = sheet_content["dataframe"]
+        normalized_data = None
+        
+        # Skip empty sheets
+        if source_df.empty or not headers:
+            return sheet_content
+    else:
         data = sheet_content["data"]
         
         # Skip empty sheets
         if not data or not headers:
-            cleaned_sheets[sheet_name] = sheet_content
-            continue
+            return sheet_content
         
         # Validate and align headers and data
         max_data_columns = max([len(row) for row in data]) if data else 0
@@ -320,79 +425,102 @@ def clean_and_transform_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
             else:
                 # Trim extra values
                 normalized_data.append(row[:len(headers)])
-        
-        # Convert to DataFrame for easier processing
-        try:
+    
+    # Convert to DataFrame for easier processing
+    try:
+        if normalized_data is None:
+            # Shallow copy, so renaming columns leaves the caller's frame alone
+            df = source_df.copy(deep=False)
+        else:
             df = pd.DataFrame(normalized_data, columns=headers)
-            
-            # 1. Standardize column names
-            # Convert to lowercase, replace spaces with underscores, remove special characters
-            df.columns = [str(col).lower().strip()
-                          .replace(' ', '_')
-                          .replace('-', '_')
-                          .translate({ord(c): None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'})  # Remove all special chars
-                          for col in df.columns]
-            
-            standardized_headers = df.columns.tolist()
-            
-            # 2. Handle missing values
-            # Replace empty strings with NaN for consistent handling
-            df = df.replace('', np.nan)
-            
-            # Drop rows where all values are NaN
-            df = df.dropna(how='all')
-            
-            # 3. Remove columns that are entirely NA
-            df = df.dropna(axis=1, how='all')
-            
-            # Update headers after column removal
-            standardized_headers = df.columns.tolist()
-            
-            # 4. Handle duplicates
-            # Remove duplicate rows
-            initial_row_count = len(df)
-            df = df.drop_duplicates()
-            if len(df) < initial_row_count:
-                logger.info(f"Removed {initial_row_count - len(df)} duplicate rows from sheet '{sheet_name}'")
-            
-            # 5. Handle outliers for numerical columns
-            numerical_cols = df.select_dtypes(include=['number']).columns
-            for col in numerical_cols:
-                try:
-                    # Check if we have enough non-null values to calculate statistics
-                    if df[col].count() > 10:  # Arbitrary threshold, adjust as needed
-                        # Calculate Q1, Q3 and IQR
-                        Q1 = df[col].quantile(0.25)
-                        Q3 = df[col].quantile(0.75)
-                        IQR = Q3 - Q1
-                        
-                        # Define bounds for outliers
-                        lower_bound = Q1 - 1.5 * IQR
-                        upper_bound = Q3 + 1.5 * IQR
-                        
-                        # Count outliers
-                        outliers_count = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col].count()
-                        
-                        # Replace outliers with NaN
-                        if outliers_count > 0:
-                            df.loc[(df[col] < lower_bound) | (df[col] > upper_bound), col] = np.nan
-                            logger.info(f"Handled {outliers_count} outliers in column '{col}' in sheet '{sheet_name}'")
-                except Exception as e:
-                    logger.warning(f"Failed to handle outliers in column '{col}' in sheet '{sheet_name}': {str(e)}")
-            
-            # Store the cleaned data
-            cleaned_sheets[sheet_name] = {
-                "headers": standardized_headers,
-                "data": df.values.tolist(),
-                "dataframe": df  # Store DataFrame for potential merging or further processing
-            }
-        except Exception as e:
-            logger.error(f"Error processing sheet '{sheet_name}': {str(e)}")
-            # Store the original data with normalized columns to prevent further errors
-            cleaned_sheets[sheet_name] = {
-                "headers": headers,
-                "data": normalized_data
-            }
+        
+        # 1. Standardize column names
+        # Convert to lowercase, replace spaces with underscores, remove special characters
+        df.columns = [str(col).lower().strip().translate(_CLEAN_TRANS) for col in df.columns]
+        
+        standardized_headers = df.columns.tolist()
+        
+        # 2. Handle missing values
+        # Replace empty strings with NaN for consistent handling
+        df = df.replace('', np.nan)
+        
+        # Drop rows where all values are NaN
+        df = df.dropna(how='all')
+        
+        # 3. Remove columns that are entirely NA
+        df = df.dropna(axis=1, how='all')
+        
+        # Update headers after column removal
+        standardized_headers = df.columns.tolist()
+        
+        # 4. Handle duplicates
+        # Remove duplicate rows
+        initial_row_count = len(df)
+        df = df.drop_duplicates()
+        if len(df) < initial_row_count:
+            logger.info(f"Removed {initial_row_count - len(df)} duplicate rows from sheet '{sheet_name}'")
+        
+        # 5. Handle outliers for numerical columns
+        # Quartiles and the outlier mask are computed for all numeric
+        # columns at once, skipping columns with too few values (10 is an
+        # arbitrary threshold, adjust as needed)
+        numerical = df.select_dtypes(include=['number'])
+        numerical = numerical.loc[:, numerical.count() > 10]
+        if not numerical.empty:
+            try:
+                # Calculate Q1, Q3 and IQR, and the bounds for outliers
+                Q1 = numerical.quantile(0.25)
+                Q3 = numerical.quantile(0.75)
+                IQR = Q3 - Q1
+                outliers = numerical.lt(Q1 - 1.5 * IQR) | numerical.gt(Q3 + 1.5 * IQR)
+                outlier_counts = outliers.sum()
+                
+                # Replace outliers with NaN
+                for col in outlier_counts.index[outlier_counts > 0]:
+                    df.loc[outliers[col], col] = np.nan
+                    logger.info(f"Handled {outlier_counts[col]} outliers in column '{col}' in sheet '{sheet_name}'")
+            except Exception as e:
+                logger.warning(f"Failed to handle outliers in sheet '{sheet_name}': {str(e)}")
+        
+        # Store the cleaned data
+        return {
+            "headers": standardized_headers,
+            "dataframe": df  # Store DataFrame for potential merging or further processing
+        }
+    except Exception as e:
+        logger.error(f"Error processing sheet '{sheet_name}': {str(e)}")
+        # Store the original data with normalized columns to prevent further errors
+        return {
+            "headers": headers,
+            "data": normalized_data if normalized_data is not None else _frame_rows(source_df)
+        }
+
+def clean_and_transform_data(sheets_data: Dict[str, Any], keep_dataframes: bool = False) -> Dict[str, Any]:
+    """
+    Clean and transform the extracted data by handling missing values, duplicates, outliers,
+    standardizing headers, and removing NA fields.
+    
+    This function performs the following transformations:
+    1. Standardizes column names (lowercase, spaces to underscores)
+    2. Handles missing values by dropping rows that are entirely empty
+    3. Removes columns that are entirely NA
+    4. Removes duplicate rows
+    5. Handles outliers in numerical columns using IQR method
+    6. Merges sheets with identical schemas (if applicable)
+    
+    Args:
+        sheets_data (Dict[str, Any]): Dictionary with sheet data extracted from Excel
+        keep_dataframes (bool): Return each cleaned sheet as a "dataframe"
+            instead of "data" rows, for callers that keep processing it
+        
+    Returns:
+        Dict[str, Any]: Cleaned and transformed sheet data
+    """
+    if not PANDAS_AVAILABLE:
+        logger.warning("Pandas not available. Skipping data cleaning and transformation.")
+        return sheets_data
+    
+    cleaned_sheets = _map_sheets(_clean_sheet, sheets_data)
     
     # Check if sheets can be merged (have the same schema)
     if len(cleaned_sheets) > 1:
@@ -412,10 +540,14 @@ def clean_and_transform_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
                 logger.info(f"Merging sheets with common schema: {', '.join(sheet_group)}")
                 
                 # Create a new merged sheet
-                merged_df = pd.concat([cleaned_sheets[sheet]["dataframe"] for sheet in sheet_group])
+                group_frames = [cleaned_sheets[sheet]["dataframe"] for sheet in sheet_group]
+                merged_df = pd.concat(group_frames)
                 
-                # Add a source column to track which sheet the data came from
-                merged_df['source_sheet'] = [sheet for sheet in sheet_group for _ in range(len(cleaned_sheets[sheet]["dataframe"]))]
+                # Add a source column to track which sheet the data came from,
+                # as a categorical built from per-row codes rather than a list
+                # of sheet names
+                codes = np.repeat(np.arange(len(sheet_group)), [len(frame) for frame in group_frames])
+                merged_df['source_sheet'] = pd.Categorical.from_codes(codes, categories=sheet_group)
                 
                 # Remove duplicate rows after merging
                 merged_df = merged_df.drop_duplicates()
@@ -424,20 +556,18 @@ def clean_and_transform_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
                 merged_sheet_name = f"merged_{'_'.join(sheet_group)}"
                 cleaned_sheets[merged_sheet_name] = {
                     "headers": merged_df.columns.tolist(),
-                    "data": merged_df.values.tolist(),
                     "dataframe": merged_df,
                     "source_sheets": sheet_group
                 }
                 
                 logger.info(f"Created merged sheet '{merged_sheet_name}' with {len(merged_df)} rows")
     
-    # Remove the DataFrame objects before returning
-    for sheet_name in cleaned_sheets:
-        if "dataframe" in cleaned_sheets[sheet_name]:
-            del cleaned_sheets[sheet_name]["dataframe"]
-        if "source_sheets" in cleaned_sheets[sheet_name]:
-            # Keep this information as metadata
-            pass
+    # Replace the DataFrame objects with row lists before returning, unless
+    # the caller takes the DataFrames; rows are only materialized once
+    if not keep_dataframes:
+        for content in cleaned_sheets.values():
+            if "dataframe" in content:
+                content["data"] = _frame_rows(content.pop("dataframe"))
     
     return cleaned_sheets
 
@@ -451,14 +581,11 @@ def _parse_excel_internal(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Parsed content
     """
-    # Extract metadata
-    metadata = extract_metadata(file_path)
-    
     # Try pandas first
     sheets_data = {}
     if PANDAS_AVAILABLE:
         try:
-            sheets_data = extract_data_with_pandas(file_path)
+            sheets_data = extract_data_with_pandas(file_path, keep_dataframes=True)
         except Exception as e:
             logger.warning(f"Failed to parse Excel with pandas: {str(e)}")
     
@@ -473,8 +600,12 @@ def _parse_excel_internal(file_path: str) -> Dict[str, Any]:
     if not sheets_data:
         return create_result_dict(error="Failed to parse Excel file with available libraries.")
     
-    # Clean and transform the data
-    cleaned_sheets = clean_and_transform_data(sheets_data)
+    # Extract metadata, reusing the sheet names the extractor already read
+    metadata = extract_metadata(file_path, list(sheets_data))
+    
+    # Clean and transform the data, handing the cleaned DataFrames straight
+    # to the numeric pass instead of rebuilding them from row lists
+    cleaned_sheets = clean_and_transform_data(sheets_data, keep_dataframes=True)
     
     # Transform numerical data
     transformed_sheets = transform_numerical_data(cleaned_sheets)
@@ -6,11 +6,7 @@ import logging
 import numpy as np
 from typing import List
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 def compute_simplified_embeddings(sentences: List[str]) -> np.ndarray:
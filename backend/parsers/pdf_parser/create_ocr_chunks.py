@@ -8,11 +8,7 @@ import re
 import math
 from typing import Dict, List, Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Placeholder for ESG keywords from constants
@@ -26,11 +26,7 @@ import sys
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Try importing PDF processing libraries
@@ -11,13 +11,15 @@ from datetime import datetime
 from typing import Dict, List, Any
 import numpy as np
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class CustomEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle numpy types and other non-standard types."""
     def default(self, obj):
@@ -31,12 +33,35 @@ class CustomEncoder(json.JSONEncoder):
             return obj.isoformat()
         return str(obj)
 
+def _write_json(obj: Any, path: str, ensure_ascii: bool = True) -> None:
+    """
+    Write obj as indented JSON, with orjson when it is installed.
+    
+    orjson handles NumPy values and datetimes natively and falls back to
+    CustomEncoder for anything else; objects orjson rejects (e.g. integers
+    beyond 64 bits) are written with the standard json module instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(
+                obj,
+                default=CustomEncoder().default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+            return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, cls=CustomEncoder, ensure_ascii=ensure_ascii, indent=2)
+
 def save_chunks_to_json(chunks: List[Dict[str, Any]], output_path: str) -> bool:
     """Save chunks to a JSON file."""
     try:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(chunks, f, cls=CustomEncoder, ensure_ascii=False, indent=2)
+        _write_json(chunks, output_path, ensure_ascii=False)
         logger.info(f"Saved {len(chunks)} chunks to {output_path}")
         return True
     except Exception as e:
@@ -51,7 +76,7 @@ def load_chunks(
     source_name: str = None
 ) -> Dict[str, Any]:
     """Load the chunks into output files and return detailed counts."""
-    filename = source_name if source_name else os.path.basename(pdf_path).split(".")[0]
+    filename = source_name if source_name else os.path.splitext(os.path.basename(pdf_path))[0]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file_path = os.path.join(output_path, f"{filename}_chunks.json")
     manifest_path = os.path.join(os.path.dirname(output_path), f"{filename}_manifest.json")
@@ -91,8 +116,7 @@ def load_chunks(
     manifest_data["last_updated"] = timestamp
     manifest_data["document_name"] = filename
     try:
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest_data, f, cls=CustomEncoder, indent=2)
+        _write_json(manifest_data, manifest_path)
         logger.info(f"Updated manifest at {manifest_path}")
     except Exception as e:
         logger.error(f"Error updating manifest: {e}")
@@ -31,11 +31,7 @@ from parsers.utils.text_utils import (
 )
 from parsers.utils.file_utils import create_directory
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 # Placeholder for ETL settings (to be replaced with actual config file)
@@ -1,15 +1,17 @@
 """Utility functions for detecting document structure."""
 
 import re
-from typing import List, Dict, Any, Tuple
+from itertools import chain
+from typing import List, Dict, Any, Tuple, Sequence, Union
 import logging
 
-def detect_headers(text: str, pages: Dict[int, str]) -> List[Dict[str, Any]]:
+def detect_headers(text: Union[str, Sequence[str]], pages: Dict[int, str]) -> List[Dict[str, Any]]:
     """
     Detect headers in document text.
     
     Args:
-        text: Full document text
+        text: Full document text, or the page texts in order; a sequence is
+            scanned as if joined with newlines, without building that string
         pages: Dictionary mapping page numbers to page text
         
     Returns:
@@ -61,9 +63,14 @@ def detect_headers(text: str, pages: Dict[int, str]) -> List[Dict[str, Any]]:
     ]
     
     line_positions = []
-    lines = text.split('\n')
+    if isinstance(text, str):
+        lines = text.split('\n')
+    else:
+        lines = chain.from_iterable(page.split('\n') for page in text)
+    line_count = 0
     
     for i, line in enumerate(lines):
+        line_count = i + 1
         line = line.strip()
         if not line:
             continue
@@ -86,10 +93,10 @@ def detect_headers(text: str, pages: Dict[int, str]) -> List[Dict[str, Any]]:
                 
     # After the pattern matching, add this fallback logic:
     # If no headers were found, create artificial section breaks based on document length
-    if not headers and len(lines) > 50:
+    if not headers and line_count > 50:
         # Create artificial sections every ~300 lines
         section_size = 300
-        for i in range(0, len(lines), section_size):
+        for i in range(0, line_count, section_size):
             if i > 0:  # Skip the very beginning
                 headers.append({
                     "text": f"Section {i // section_size}",
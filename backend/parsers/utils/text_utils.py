@@ -13,8 +13,7 @@ import logging
 import nltk
 from typing import Callable, List
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
 def clean_text(text: str) -> str:
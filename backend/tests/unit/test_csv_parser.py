@@ -0,0 +1,196 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Setup path to allow importing from project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Import the module for testing
+from backend.parsers import csv_parser
+from backend.parsers.csv_parser import (
+    parse_csv,
+    extract_data_streaming,
+    _detect_encoding_from_bytes,
+    _delimiter_from_lines,
+    _read_csv_frame,
+    _sniff_dialect,
+)
+
+
+class TestEncodingDetection:
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("site,co2\n".encode("utf-8-sig"), "UTF-8-SIG"),
+        ("site,co2\n".encode("utf-16"), "UTF-16"),
+        ("site,co2\n".encode("utf-32"), "UTF-32"),
+        (b"site,co2\nA,10\n", "ascii"),
+        ("site,city\nA,Z\u00fcrich\n".encode("utf-8"), "utf-8"),
+    ])
+    def test_shortcuts(self, raw, expected):
+        """Test that BOMs, ASCII and valid UTF-8 are recognised without the detector."""
+        assert _detect_encoding_from_bytes(raw) == expected
+
+    def test_utf8_cut_at_sample_boundary(self):
+        """Test that a multi-byte character split by the sample limit is still UTF-8."""
+        raw = b"a" + "\u00e9".encode("utf-8") * csv_parser.ENCODING_SAMPLE_SIZE
+        assert _detect_encoding_from_bytes(raw) == "utf-8"
+
+
+class TestDelimiterDetection:
+
+    def test_title_line_does_not_decide(self):
+        """Test that the modal field count over the sample lines wins, not the first line."""
+        lines = ["Report, FY2023\n", "a;b;c\n", "1;2;3\n", "4;5;6\n"]
+        assert _delimiter_from_lines(lines) == ";"
+
+    def test_quoted_fields_are_ignored(self):
+        """Test that delimiters inside quoted fields are not counted."""
+        lines = ['name|note\n', '"Smith, J"|"x, y, z"\n', '"Doe, A"|ok\n']
+        assert _delimiter_from_lines(lines) == "|"
+
+    def test_comments_and_blank_lines_are_skipped(self):
+        """Test that comment and blank lines do not count towards the score."""
+        lines = ["# exported; by; tool\n", "\n", "a\tb\n", "1\t2\n"]
+        assert _delimiter_from_lines(lines) == "\t"
+
+    def test_ties_and_no_candidates_default_to_comma(self):
+        """Test that ties go to the earlier candidate and no match gives ','."""
+        assert _delimiter_from_lines(["a;b,c\n"]) == ","
+        assert _delimiter_from_lines(["just text\n"]) == ","
+
+
+class TestReadCsvFrame:
+
+    def test_pandas_fallback_matches_pyarrow(self, tmp_path, monkeypatch):
+        """Test that the pandas reader gives the same frame as the pyarrow one."""
+        pytest.importorskip("pyarrow")
+        file_path = tmp_path / "emissions.csv"
+        file_path.write_text("site,co2,share\nA,10,0.5\nB,20,\n")
+        with_pyarrow = _read_csv_frame(str(file_path), "ascii", ",", 0)
+        monkeypatch.setattr(csv_parser, "PYARROW_AVAILABLE", False)
+        with_pandas = _read_csv_frame(str(file_path), "ascii", ",", 0)
+        pd.testing.assert_frame_equal(with_pyarrow, with_pandas)
+
+    def test_ragged_rows_are_padded(self, tmp_path):
+        """Test that short rows, which pyarrow rejects, are padded with NaN."""
+        file_path = tmp_path / "ragged.csv"
+        file_path.write_text("site,co2,year\nA,10,2020\nB,20\n")
+        df = _read_csv_frame(str(file_path), "ascii", ",", 0)
+        assert df.shape == (2, 3)
+        assert pd.isna(df.loc[1, "year"])
+
+
+class TestStreaming:
+
+    def test_chunked_statistics_match_whole_file(self, tmp_path):
+        """Test that statistics accumulated over chunks match the whole column."""
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5]
+        file_path = tmp_path / "large.csv"
+        file_path.write_text("site,co2\n" + "".join(f"S{i},{v}\n" for i, v in enumerate(values)))
+
+        result = extract_data_streaming(str(file_path), "ascii", ",", 0, chunksize=4, preview_rows=3)
+        series = pd.Series(values)
+        stats = result["statistics"]["co2"]
+        assert result["shape"] == (len(values), 2)
+        assert len(result["dataframe"]) == 3
+        assert (stats["min"], stats["max"]) == (1, 9)
+        assert stats["mean"] == pytest.approx(series.mean())
+        assert stats["median"] == pytest.approx(series.median())
+        assert stats["std"] == pytest.approx(series.std())
+
+    def test_parse_csv_reports_streamed_files(self, tmp_path, monkeypatch):
+        """Test that files above STREAMING_THRESHOLD are marked and keep their full row count."""
+        monkeypatch.setattr(csv_parser, "STREAMING_THRESHOLD", 0)
+        file_path = tmp_path / "large.csv"
+        file_path.write_text("Site Name,CO2\nA,10\nB,20\nC,30\n")
+
+        result = parse_csv(str(file_path))
+        assert result["metadata"]["streamed"] is True
+        assert result["shape"] == (3, 2)
+        assert result["statistics"]["co2"]["max"] == 30
+
+
+class TestParseCsv:
+
+    def test_semicolon_file(self, tmp_path):
+        """Test that semicolon-separated files are split on ';'."""
+        file_path = tmp_path / "semicolon.csv"
+        file_path.write_text("site;co2;year\nA;10;2020\nB;20;2021\n")
+        result = parse_csv(str(file_path))
+        assert result["metadata"]["delimiter"] == ";"
+        assert result["columns"] == ["site", "co2", "year"]
+        assert result["data"] == [["A", 10, 2020], ["B", 20, 2021]]
+
+    def test_latin1_file(self, tmp_path):
+        """Test that Latin-1 text is detected and decoded."""
+        file_path = tmp_path / "latin1.csv"
+        file_path.write_bytes("site,city,co2\nA,Z\u00fcrich,10\nB,Montr\u00e9al,20\nC,M\u00e1laga,30\n".encode("latin-1"))
+        result = parse_csv(str(file_path))
+        assert result["metadata"]["encoding"].lower() in ("iso-8859-1", "windows-1252")
+        assert [row[1] for row in result["data"]] == ["Z\u00fcrich", "Montr\u00e9al", "M\u00e1laga"]
+
+    def test_bom_is_not_part_of_the_header(self, tmp_path):
+        """Test that a UTF-8 BOM does not end up in the first column name."""
+        file_path = tmp_path / "bom.csv"
+        file_path.write_bytes("site,co2\nA,10\nB,20\n".encode("utf-8-sig"))
+        result = parse_csv(str(file_path))
+        assert result["metadata"]["encoding"] == "UTF-8-SIG"
+        assert result["columns"] == ["site", "co2"]
+
+    def test_preamble_rows_are_skipped(self, tmp_path):
+        """Test that title rows above the header are detected and skipped."""
+        file_path = tmp_path / "preamble.csv"
+        file_path.write_text("ESG Emissions Report,,\nGenerated 2024,,\n,,\nsite,co2,year\n"
+                             "A,10,2020\nB,20,2021\nC,30,2022\n")
+        assert _sniff_dialect(str(file_path))[2] == 3
+        result = parse_csv(str(file_path))
+        assert result["columns"] == ["site", "co2", "year"]
+        assert result["data"][0] == ["A", 10, 2020]
+
+    def test_ragged_rows(self, tmp_path):
+        """Test that missing trailing fields come back as None."""
+        file_path = tmp_path / "ragged.csv"
+        file_path.write_text("site,co2,year\nA,10,2020\nB,20\nC,30,2022\n")
+        result = parse_csv(str(file_path))
+        assert result["data"] == [["A", 10, 2020], ["B", 20, None], ["C", 30, 2022]]
+
+    def test_columnar_layout_matches_rows(self, tmp_path):
+        """Test that the columnar layout holds the same values as the rows layout."""
+        file_path = tmp_path / "emissions.csv"
+        file_path.write_text("site,co2\nA,10\nB,\n")
+        rows = parse_csv(str(file_path))
+        columnar = parse_csv(str(file_path), layout="columnar")
+        assert "data" not in columnar
+        assert columnar["column_data"] == {
+            col: [row[i] for row in rows["data"]] for i, col in enumerate(rows["columns"])
+        }
+
+    def test_low_memory_dtypes(self, tmp_path):
+        """Test that repetitive text stays categorical and numbers are widened again."""
+        file_path = tmp_path / "emissions.csv"
+        file_path.write_text("site,co2\n" + "".join(f"{'AB'[i % 2]},{i}\n" for i in range(20)))
+        result = parse_csv(str(file_path), low_memory_dtypes=True)
+        assert result["dtypes"] == {"site": "category", "co2": "Int64"}
+        assert result["data"][:2] == [["A", 0], ["B", 1]]
+
+    def test_results_are_not_shared(self, tmp_path):
+        """Test that mutating a returned result does not leak into the next call."""
+        file_path = tmp_path / "emissions.csv"
+        file_path.write_text("site,co2\nA,10\nB,20\n")
+
+        first = parse_csv(str(file_path))
+        assert "error" not in first
+        first["data"][0][0] = "mutated"
+        first["columns"].append("extra")
+        first["metadata"]["note"] = "mutated"
+        first["statistics"]["co2"]["mean"] = -1
+
+        second = parse_csv(str(file_path))
+        assert second["data"][0][0] == "A"
+        assert second["columns"] == ["site", "co2"]
+        assert "note" not in second["metadata"]
+        assert second["statistics"]["co2"]["mean"] == 15
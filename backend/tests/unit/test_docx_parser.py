@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+# Setup path to allow importing from project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Import the module for testing
+from backend.parsers.docx_parser import parse_docx, _parse_docx_cached
+
+
+class TestParseDocx:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty result cache."""
+        parse_docx.cache_clear()
+        yield
+        parse_docx.cache_clear()
+
+    @pytest.fixture
+    def docx_path(self, tmp_path):
+        """A small document with one heading, one paragraph and one table."""
+        doc = Document()
+        doc.add_heading("Emissions", level=1)
+        doc.add_paragraph("Scope 1 totals by site")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "site"
+        table.cell(0, 1).text = "co2"
+        table.cell(1, 0).text = "A"
+        table.cell(1, 1).text = "10"
+        file_path = tmp_path / "report.docx"
+        doc.save(str(file_path))
+        return str(file_path)
+
+    def test_repeated_calls_hit_the_cache(self, docx_path):
+        """Test that an unchanged file is parsed only once."""
+        parse_docx(docx_path)
+        parse_docx(docx_path)
+        assert _parse_docx_cached.cache_info().hits == 1
+
+    def test_cached_result_is_not_shared(self, docx_path):
+        """Test that mutating a returned result does not leak into the next call."""
+        first = parse_docx(docx_path)
+        assert first["sections"][0]["heading"] == "Emissions"
+        assert first["tables"][0]["content"][1] == ["A", "10"]
+        first["sections"][0]["heading"] = "mutated"
+        first["sections"].append({"heading": "extra", "content": ""})
+        first["tables"][0]["content"][1][0] = "mutated"
+        first["metadata"]["note"] = "mutated"
+
+        second = parse_docx(docx_path)
+        assert second["sections"][0]["heading"] == "Emissions"
+        assert len(second["sections"]) == 1
+        assert second["tables"][0]["content"][1] == ["A", "10"]
+        assert "note" not in second["metadata"]
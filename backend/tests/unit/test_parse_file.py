@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+# Setup path to allow importing from project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Import the module for testing
+from backend.parsers import parse_file, parse_files, _get_parser
+
+TEST_FILES = Path(__file__).resolve().parent.parent.parent / "test_files"
+
+class TestParseFile:
+
+    def test_dispatches_docx_to_docx_parser(self):
+        """Test that DOCX files are routed to the lazily imported DOCX parser."""
+        result = parse_file(str(TEST_FILES / "Exit Ticket 5.docx"))
+        assert "error" not in result
+        assert result["metadata"]["filename"] == "Exit Ticket 5.docx"
+
+    def test_parser_lookup_is_cached(self):
+        """Test that repeated lookups return the same parse function."""
+        assert _get_parser("xlsx") is _get_parser("xlsx")
+        assert _get_parser("xlsx").__name__ == "parse_excel"
+
+    def test_unsupported_extension(self, tmp_path):
+        """Test that unknown extensions return an error instead of raising."""
+        file_path = tmp_path / "notes.txt"
+        file_path.write_text("plain text")
+        assert parse_file(str(file_path)) == {"error": "Unsupported file type: txt"}
+
+    def test_missing_file(self):
+        """Test that missing files are reported before dispatch."""
+        assert "error" in parse_file("/nonexistent/file.csv")
+
+    def test_parse_files_keeps_input_order(self, tmp_path):
+        """Test that batch parsing returns one result per path, in order."""
+        file_path = tmp_path / "notes.txt"
+        file_path.write_text("plain text")
+        paths = [str(TEST_FILES / "Exit Ticket 5.docx"), str(file_path), "/nonexistent/file.csv"]
+        results = parse_files(paths, max_workers=2)
+        assert len(results) == 3
+        assert results[0]["metadata"]["filename"] == "Exit Ticket 5.docx"
+        assert results[1] == {"error": "Unsupported file type: txt"}
+        assert "error" in results[2]
@@ -24,6 +24,7 @@ from backend.utils.robust_etl import (
     _build_chart_payloads,
     _detect_encoding,
     _detect_delimiter,
+    _detect_encoding_and_delimiter,
     _nan_to_none,
     _find_real_header_index,
     _slice_to_excel_range
@@ -300,6 +301,24 @@ value1\tvalue2\tvalue3
     
     assert delimiter == '\t'
 
+@patch('backend.utils.robust_etl.get_logger')
+def test_detect_encoding_and_delimiter_matches_separate_detection(mock_get_logger, tmp_path):
+    """Test that single-pass detection agrees with the separate helpers."""
+    mock_get_logger.return_value = MagicMock()
+    
+    content = "column1;column2;column3\nvalue1;value2;value3\n".encode('utf-8')
+    file_path = tmp_path / "semicolon.csv"
+    file_path.write_bytes(content)
+    
+    expected_encoding = _detect_encoding(str(file_path))
+    expected = (expected_encoding, _detect_delimiter(str(file_path), expected_encoding))
+    assert _detect_encoding_and_delimiter(str(file_path)) == expected
+    assert expected[1] == ';'
+    
+    file_obj = io.BytesIO(content)
+    assert _detect_encoding_and_delimiter(file_obj) == expected
+    assert file_obj.tell() == 0
+
 @patch('backend.utils.robust_etl.get_logger')
 def test_etl_to_chart_payload_basic(mock_get_logger, sample_csv_data):
     """Test the main ETL function with a simple CSV."""
@@ -182,6 +182,15 @@ class TestStructureUtils:
         if len(headers) >= 2:
             assert headers[0]["level"] <= headers[1]["level"]  # First header should be same or higher level
     
+    def test_detect_headers_accepts_page_sequence(self, sample_document_pages):
+        """Test that ordered page texts give the same headers as the joined text."""
+        pages = [sample_document_pages[i] for i in sorted(sample_document_pages)]
+        assert detect_headers(pages, sample_document_pages) == detect_headers("\n".join(pages), sample_document_pages)
+        
+        # Artificial section breaks count lines across pages
+        filler = ["plain line"] * 40
+        assert detect_headers(["\n".join(filler)] * 10, {}) == detect_headers("\n".join(["\n".join(filler)] * 10), {})
+    
     def test_build_section_hierarchy_from_headers(self):
         """Test building section hierarchy from detected headers."""
         # Create a sample set of headers
@@ -0,0 +1,61 @@
+import os
+import sys
+import json
+import pytest
+import tempfile
+from pathlib import Path
+
+# Setup path to allow importing from project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+# Import the module for testing
+from backend.parsers import (
+    PYARROW_AVAILABLE,
+    write_parquet_rows,
+    load_tabular_output
+)
+
+pytestmark = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+
+class TestTabularOutput:
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    def test_round_trip_csv_rows(self, temp_dir):
+        """Test that CSV rows survive a Parquet round trip with None for missing values."""
+        rows = [[1, "a", 0.5], [2, None, None], [3, "c", 1.5]]
+        assert write_parquet_rows(rows, ["id", "name", "ratio"], os.path.join(temp_dir, "data.parquet"))
+
+        meta_path = os.path.join(temp_dir, "data_document.meta.json")
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({"columns": ["id", "name", "ratio"], "data_files": "data.parquet"}, f)
+
+        result = load_tabular_output(meta_path)
+        assert result["data"] == rows
+        assert "data_files" not in result
+
+    def test_round_trip_excel_sheets(self, temp_dir):
+        """Test that per-sheet data files are restored as a dict of rows."""
+        sheets = {"Sheet1": [[1, "x"]], "Sheet2": [[2.5, "y"]]}
+        data_files = {}
+        for index, (sheet, rows) in enumerate(sheets.items()):
+            data_files[sheet] = f"sheet{index}.parquet"
+            assert write_parquet_rows(rows, ["a", "b"], os.path.join(temp_dir, data_files[sheet]))
+
+        meta_path = os.path.join(temp_dir, "book_document.meta.json")
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({"data_files": data_files}, f)
+
+        assert load_tabular_output(meta_path)["data"] == sheets
+
+    def test_mixed_type_column_is_rejected(self, temp_dir):
+        """Test that untypeable data reports failure and leaves no partial file."""
+        output_path = os.path.join(temp_dir, "mixed.parquet")
+        assert not write_parquet_rows([[1], ["*"]], ["value"], output_path)
+        assert not os.path.exists(output_path)
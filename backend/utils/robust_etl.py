@@ -733,8 +733,7 @@ def _load_raw_sheet_data(fp: str | io.BytesIO, file_type: str, sheet_name: str,
             )
         elif file_type == 'csv':
             if isinstance(fp, io.BytesIO): fp.seek(0)
-            encoding = _detect_encoding(fp)
-            delimiter = _detect_delimiter(fp, encoding)
+            encoding, delimiter = _detect_encoding_and_delimiter(fp)
             logger.debug(f"CSV Params: encoding='{encoding}', delimiter='{repr(delimiter)}'")
             
             logger.debug("Reading full CSV raw (header=None)")
@@ -1706,7 +1705,6 @@ def _build_chart_payloads(df, meta):
 # ─────────────────────────────────────────────────────────────────────────────
 def _detect_delimiter(fp: str | io.BytesIO, encoding: str) -> str:
     """Detect the delimiter of a CSV file using csv.Sniffer, ignoring comment lines."""
-    logger = get_logger()
     sample_bytes = b''
     try:
         if isinstance(fp, io.BytesIO):
@@ -1717,6 +1715,18 @@ def _detect_delimiter(fp: str | io.BytesIO, encoding: str) -> str:
         else:
             with open(fp, 'rb') as f_sniff:
                 sample_bytes = f_sniff.read(4096)
+    except Exception as e:
+        get_logger().warning(f"Could not read delimiter sample: {type(e).__name__} - {str(e)}. Defaulting to ','.")
+        if isinstance(fp, io.BytesIO):
+            try: fp.seek(original_pos)
+            except NameError: fp.seek(0)
+        return ','
+    return _sniff_delimiter(sample_bytes, encoding)
+
+def _sniff_delimiter(sample_bytes: bytes, encoding: str) -> str:
+    """Sniff the delimiter from an already-read sample, ignoring comment lines."""
+    logger = get_logger()
+    try:
         if not sample_bytes:
             logger.warning("No content to sniff delimiter, defaulting to ','")
             return ','
@@ -1732,9 +1742,6 @@ def _detect_delimiter(fp: str | io.BytesIO, encoding: str) -> str:
         return dialect.delimiter
     except (csv.Error, UnicodeDecodeError, Exception) as e:
         logger.warning(f"Could not sniff delimiter: {type(e).__name__} - {str(e)}. Defaulting to ','.")
-        if isinstance(fp, io.BytesIO):
-            try: fp.seek(original_pos)
-            except NameError: fp.seek(0)
         return ','
 
 def _infer_extension(fp, original):
@@ -1764,12 +1771,30 @@ def _detect_encoding(fp: str | io.BytesIO) -> str:
     Returns:
         str: Detected encoding (defaults to utf-8 if detection fails)
     """
+    return _detect_encoding_with_sample(fp)[0]
+
+
+def _detect_encoding_with_sample(fp: str | io.BytesIO) -> tuple[str, bytes]:
+    """
+    Detect the encoding of a file, also returning its first 4096 bytes.
+
+    The sample is the first chunk fed to the encoding detector, so callers
+    that also sniff the delimiter do not have to read the file again.
+
+    Args:
+        fp: File path or BytesIO object
+
+    Returns:
+        tuple: (encoding, sample bytes); the encoding defaults to utf-8
+    """
+    sample_bytes = b''
     try:
         det = UniversalDetector()
         
         if isinstance(fp, io.BytesIO):
             # For BytesIO, read the content directly
             content = fp.getvalue()
+            sample_bytes = content[:4096]
             det.feed(content)
             det.close()
             # Reset the BytesIO position for subsequent reads
@@ -1778,19 +1803,38 @@ def _detect_encoding(fp: str | io.BytesIO) -> str:
             # For file paths, read in chunks
             with open(fp, 'rb') as f:
                 for chunk in iter(lambda: f.read(4096), b''):
+                    if not sample_bytes:
+                        sample_bytes = chunk
                     det.feed(chunk)
                     if det.done:
                         break
                 det.close()
         
         if det.result['encoding']:
-            return det.result['encoding']
+            return det.result['encoding'], sample_bytes
         else:
             get_logger().debug("No encoding detected, defaulting to utf-8")
-            return 'utf-8'
+            return 'utf-8', sample_bytes
     except Exception as e:
         get_logger().warning(f"Error detecting encoding: {str(e)}, defaulting to utf-8")
-        return 'utf-8'
+        return 'utf-8', sample_bytes
+
+
+def _detect_encoding_and_delimiter(fp: str | io.BytesIO) -> tuple[str, str]:
+    """
+    Detect the encoding and delimiter of a CSV file in a single pass.
+
+    The sample read for encoding detection is reused for the delimiter,
+    so the file is only opened once.
+
+    Args:
+        fp: File path or BytesIO object
+
+    Returns:
+        tuple: (encoding, delimiter), defaulting to ('utf-8', ',')
+    """
+    encoding, sample_bytes = _detect_encoding_with_sample(fp)
+    return encoding, _sniff_delimiter(sample_bytes, encoding)
 
 
 def _split_on_nan_columns(df):
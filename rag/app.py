@@ -669,6 +669,32 @@ def query():
     return flask.jsonify({"success": True, "response": response}), 200
 
 
+@app.route("/api/v1/query/stream", methods=["POST"])
+def query_stream():
+    """
+    Query the graph database, streaming the answer as server-sent events.
+    """
+    app.logger.info(f"---------------/api/v1/query/stream-----------------")
+    data = flask.request.json
+    query = data.get("query")
+    llm_service = LLMService()
+
+    def events():
+        try:
+            for text in llm_service.handle_query_stream(query):
+                yield f"data: {json.dumps({'delta': text})}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            app.logger.error(f"Error streaming query response: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+    return flask.Response(
+        flask.stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/api/v1/get-graph-files", methods=["GET"])
 @require_neo4j
 def get_graph_files():
@@ -3,7 +3,9 @@
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import os
+import sys
 import subprocess
+from functools import wraps
 from typing import Optional
 from neo4j import Driver, Session
 
@@ -20,6 +22,23 @@ neo4j_password = os.getenv("NEO4J_PASSWORD")
 driver = GraphDatabase.driver(neo4j_uri, auth=(None, None))
 
 
+def invalidates_query_cache(method):
+    """
+    Decorator for methods that write to the graph: drop the Cypher results
+    cached by LLMService once the write has run, even if it failed halfway.
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            # Only a process that has loaded LLMService can hold cached results
+            llmservice = sys.modules.get("rag.llmservice")
+            if llmservice is not None:
+                llmservice.LLMService.invalidate()
+    return wrapper
+
+
 class Neo4jGraphInitializer:
     """
     Class to manage Neo4j Docker initialization and graph setup for org/user nodes.
@@ -223,6 +242,7 @@ class Neo4jGraphInitializer:
         self.driver = GraphDatabase.driver(self.uri)
         return self.driver
 
+    @invalidates_query_cache
     def initializeGraphWithRoot(self, rootLabel: str = "Root") -> None:
         """
         Initialize the graph with a root node if not present.
@@ -232,6 +252,7 @@ class Neo4jGraphInitializer:
         with self.driver.session() as session:
             session.run(f"MERGE (r:{rootLabel} {{name: 'root'}})")
 
+    @invalidates_query_cache
     def createOrgNode(self, orgId: str, rootLabel: str = "Root") -> None:
         """
         Create an organization node and connect to root.
@@ -259,6 +280,7 @@ class Neo4jGraphInitializer:
             )
             return result.single() is not None
 
+    @invalidates_query_cache
     def createUserNode(
         self,
         userId: str,
@@ -293,6 +315,7 @@ class Neo4jGraphInitializer:
                     {"userId": userId, "email": email},
                 )
 
+    @invalidates_query_cache
     def deleteUserNode(self, userId: str, rootLabel: str = "Root") -> None:
         """
         Delete a user node.
@@ -309,6 +332,7 @@ class Neo4jGraphInitializer:
                 {"userId": userId},
             )
 
+    @invalidates_query_cache
     def deleteOrgNode(self, orgId: str, rootLabel: str = "Root") -> None:
         """
         Delete an organization node.
@@ -337,6 +361,7 @@ class Neo4jGraphInitializer:
             )
             return result.single() is not None
 
+    @invalidates_query_cache
     def deleteSubgraph(self, userId: str, rootLabel: str = "Root") -> None:
         """
         Delete a subgraph for a user by:
@@ -384,6 +409,7 @@ class Neo4jGraphInitializer:
             print(f"Error deleting subgraph: {str(e)}")
             raise
 
+    @invalidates_query_cache
     def createSubgraph(
         self, entities: list, relationships: list, userId: str, rootLabel: str = "Root"
     ) -> None:
@@ -502,6 +528,7 @@ class Neo4jGraphInitializer:
             print(f"Error creating subgraph: {str(e)}")
             return None
 
+    @invalidates_query_cache
     def buildGraphProjection(self, graphName: str, rootLabel: str = "Root") -> None:
         """
         Build a graph projection for a subgraph.
@@ -534,6 +561,7 @@ class Neo4jGraphInitializer:
             print(f"Error getting subgraph id: {str(e)}")
             return None  # if no subgraph id is found, return None
 
+    @invalidates_query_cache
     def runCommunityDetection(
         self,
         projection_name: str,
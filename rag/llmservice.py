@@ -1,18 +1,208 @@
 from openai import OpenAI
+import httpx
 import os
+import re
 import json
+import time
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import Future
+from collections import OrderedDict
+import numpy as np
 from rag.initialize_neo4j import Neo4jGraphInitializer
 from supabase import create_client
 from datetime import datetime
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
-class Prompts:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+_openai_client = None
+_llm_cache = None
+
+# Chat completions currently being fetched, keyed by LLMCache key
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _content_hash(text):
+    """Return a stable 64-bit hash of `text`, using xxhash when available."""
+    data = text.encode("utf-8")
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def dedupe_summaries(summaries):
+    """Drop repeated summaries (e.g. stored under several communities), keeping first-seen order."""
+    seen = set()
+    unique = []
+    for summary in summaries:
+        if summary is None:
+            continue
+        digest = _content_hash(summary)
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(summary)
+    return unique
+
+
+def _get_openai_client():
+    """
+    Return the process-wide OpenAI client, creating it lazily.
+
+    The Flask endpoints build a new LLMService per request, so sharing one
+    client (and its pooled httpx connections) avoids a TCP/TLS handshake
+    per call. The read timeout stays at the SDK's 600 s default so long
+    completions such as report generation are not cut off; only connecting
+    is bounded tightly.
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+                timeout=httpx.Timeout(600.0, connect=5.0),
+            ),
+        )
+    return _openai_client
+
+
+def _get_llm_cache():
+    """Return the process-wide LLM response cache, creating it lazily."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache(_get_openai_client(), path=os.getenv("LLM_CACHE_PATH"))
+    return _llm_cache
+
+
+class LLMCache:
+    """
+    Two-tier cache in front of chat completions.
+
+    The exact tier maps a hash of (model, prompt) to the response text and is
+    LRU-evicted. The semantic tier keeps normalized embeddings of the texts it
+    was asked to index and returns a stored response when a new text has a
+    cosine similarity above `similarity_threshold`. When `path` is given, the
+    exact tier is also persisted to SQLite so it survives process restarts.
+    The instance is shared across request threads, so the in-memory tiers
+    and the SQLite connection are only touched under `_lock`.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        maxsize=1024,
+        similarity_threshold=0.95,
+        embedding_model="text-embedding-3-small",
+        path=None,
+    ):
+        self.client = client
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.exact = OrderedDict()
+        self.vectors = []
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response TEXT)"
+            )
+            self._db.commit()
 
     @staticmethod
-    def query_classification(user_query):
-        return f"""
+    def make_key(model, prompt):
+        return hashlib.blake2b(
+            f"{model}\x00{prompt}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def get(self, key):
+        """Return the cached response for an exact key, or None."""
+        with self._lock:
+            if key in self.exact:
+                self.exact.move_to_end(key)
+                return self.exact[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    return row[0]
+            return None
+
+    def put(self, key, response, embedding=None):
+        """Store a response under an exact key and, optionally, its embedding."""
+        with self._lock:
+            self._remember(key, response)
+            if embedding is not None:
+                self.vectors.append((embedding, response))
+                if len(self.vectors) > self.maxsize:
+                    self.vectors.pop(0)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)",
+                    (key, response),
+                )
+                self._db.commit()
+
+    def embed(self, text):
+        """Return a unit-length embedding for `text`, or None if unavailable."""
+        if self.client is None:
+            return None
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model, input=text
+            )
+        except Exception as e:
+            print(f"Error embedding text for the LLM cache: {e}")
+            return None
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def lookup_similar(self, embedding):
+        """Return the response of the most similar indexed text above the threshold."""
+        if embedding is None:
+            return None
+        with self._lock:
+            # Snapshot so the matrix and the responses stay aligned
+            vectors = list(self.vectors)
+        if not vectors:
+            return None
+        matrix = np.vstack([vector for vector, _ in vectors])
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            return vectors[best][1]
+        return None
+
+    def _remember(self, key, response):
+        # Callers hold self._lock
+        self.exact[key] = response
+        self.exact.move_to_end(key)
+        if len(self.exact) > self.maxsize:
+            self.exact.popitem(last=False)
+
+
+# Cheap pre-classification for obviously global queries: a broad-summary
+# phrase and no capitalized words after the first one (names, acronyms),
+# which would need the LLM to extract entities
+_GLOBAL_QUERY_RE = re.compile(
+    r"\b(overall|key trends?|main themes?|summar(?:y|ise|ize)|across (?:all|the)|in general|big picture)\b",
+    re.IGNORECASE,
+)
+_CAPITALIZED_WORD_RE = re.compile(r"\s[A-Z][\w&'-]*")
+
+# Template for Prompts.query_classification; "__QUERY__" is replaced with the user query
+_QUERY_CLASSIFICATION_TEMPLATE = """
         You are a helpful assistant. Your task is to classify a user query into one of the following types:
 
     - **global**: The query asks for a broad, high-level summary across an entire dataset or a wide theme (e.g., "What are the key trends in sustainability in 2023?").
@@ -20,7 +210,7 @@ class Prompts:
 
     ---
 
-        **Query**: "{user_query}"
+        **Query**: "__QUERY__"
 
         **Instructions**:
         1. Classify the query as either **global** or **entity**.
@@ -29,13 +219,24 @@ class Prompts:
 
     **Output format** (JSON):
     ```json
-    {{
-    "query": "{user_query}",
+    {
+    "query": "__QUERY__",
     "type": "<global | entity>",
     "entities": ["<entity1>", "<entity2>", ...]
-    }}
+    }
     """
 
+
+class Prompts:
+    def __init__(self):
+        self.client = _get_openai_client()
+
+    @staticmethod
+    def query_classification(user_query):
+        # Plain replace on a prebuilt template; the JSON braces in the
+        # example output never need escaping
+        return _QUERY_CLASSIFICATION_TEMPLATE.replace("__QUERY__", user_query)
+
     @staticmethod
     def generate_report(documents, report_type, custom_prompt):
         base_prompt = """You are an expert ESG reporting assistant specialized in generating comprehensive, structured reports compliant with {standard} standards ({year}). Your task is to synthesize information from the provided documents into clear, actionable, and reference-backed report sections.
@@ -88,27 +289,126 @@ class Prompts:
 
 
 class LLMService:
+    # Shared across instances: the Flask endpoints build a new LLMService per request.
+    _cypher_cache = {}
+    _cypher_cache_lock = threading.Lock()
+
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = _get_openai_client()
         self.model = "gpt-3.5-turbo"
         self.neo4j_client = Neo4jGraphInitializer()
         self.driver = self.neo4j_client.getNeo4jDriver()
         self.session = self.driver.session()
+        self.cache = _get_llm_cache()
+
+    def _cached_completion(self, prompt, model=None, semantic_text=None, **kwargs):
+        """
+        Run a single-message chat completion through the LLM cache.
+
+        `semantic_text` is the text used for near-duplicate matching (e.g. the
+        raw user query); when omitted only exact prompt matches are reused.
+        Only pass it for outputs that do not echo the input back: a near
+        match is returned verbatim, and each exact-cache miss costs an
+        embeddings call.
+        """
+        model = model or self.model
+        key = LLMCache.make_key(model, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent requests for the same key wait on the
+        # call already in progress instead of issuing a duplicate one
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                _inflight[key] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            content = self._complete_uncached(key, prompt, model, semantic_text, **kwargs)
+            future.set_result(content)
+            return content
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _complete_uncached(self, key, prompt, model, semantic_text, **kwargs):
+        embedding = None
+        if semantic_text is not None:
+            embedding = self.cache.embed(semantic_text)
+            cached = self.cache.lookup_similar(embedding)
+            if cached is not None:
+                self.cache.put(key, cached)
+                return cached
+
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
+        )
+        content = response.choices[0].message.content
+        self.cache.put(key, content, embedding)
+        return content
+
+    def _cached_query(self, query, params=None, ttl=60):
+        """Run a read-only Cypher query, reusing results younger than `ttl` seconds."""
+        params = params or {}
+        key = query + json.dumps(params, sort_keys=True, default=str)
+        now = time.monotonic()
+        with self._cypher_cache_lock:
+            cached = self._cypher_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        records = [record.data() for record in self.session.run(query, params)]
+        with self._cypher_cache_lock:
+            for stale_key in [k for k, (ts, _) in self._cypher_cache.items() if now - ts >= ttl]:
+                del self._cypher_cache[stale_key]
+            self._cypher_cache[key] = (now, records)
+        return records
+
+    @classmethod
+    def invalidate(cls):
+        """Drop cached Cypher results; Neo4jGraphInitializer's write methods call this."""
+        with cls._cypher_cache_lock:
+            cls._cypher_cache.clear()
+
+    @staticmethod
+    def classify_without_llm(request):
+        """Return a normalized request for trivial queries, or None if the LLM is needed."""
+        if len(request.strip()) < 3:
+            return {"query": request, "type": "global", "entities": []}
+        if _GLOBAL_QUERY_RE.search(request) and not _CAPITALIZED_WORD_RE.search(request):
+            return {"query": request, "type": "global", "entities": []}
+        return None
 
     def normalize_request(self, request):
         "Use gpt-4o to normalize the request to a structured format"
+        normalized = self.classify_without_llm(request)
+        if normalized is not None:
+            return normalized
+
+        # Exact matches only: the classification echoes the query and its
+        # entities, so a near-duplicate about another year or company must
+        # not reuse it
         prompt = Prompts.query_classification(request)
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+        content = self._cached_completion(
+            prompt,
             response_format={"type": "json_object"},
         )
-        response_json = json.loads(response.choices[0].message.content)
+        response_json = json.loads(content)
         return response_json
 
     def select_community_summaries(self, request):
         # Get the user's query
-        user_query = request.query
+        user_query = request.get("query")
 
         # Get the community summaries
         # TODO: Get the community summaries from the database
@@ -118,8 +418,8 @@ class LLMService:
         MATCH (n:Summary)
         RETURN n.summary
         """
-        results = self.client.query(query)
-        community_summaries = [result["n.summary"] for result in results]
+        results = self._cached_query(query)
+        community_summaries = dedupe_summaries(result["n.summary"] for result in results)
 
         # Select the relevant summaries
         # TODO: Select the relevant summaries from the community summaries
@@ -135,13 +435,15 @@ class LLMService:
             # TODO: Get the community summaries from the database
             community_summaries = []
             # Neo4j query to get the community summaries
+            # Keep the query text constant and pass values as parameters so
+            # Neo4j can reuse its cached execution plan across requests
             query = """
             MATCH (n:Summary)
-            WHERE n.entities CONTAINS $entities
+            WHERE any(entity IN $entities WHERE n.entities CONTAINS entity)
             RETURN n.summary
             """
-            results = self.neo4j_client.query(query, {"entities": entities})
-            community_summaries = [result["n.summary"] for result in results]
+            results = self._cached_query(query, {"entities": entities or [user_query]})
+            community_summaries = dedupe_summaries(result["n.summary"] for result in results)
 
             # Select the relevant summaries
             # TODO: Select the relevant summaries from the community summaries
@@ -157,7 +459,7 @@ class LLMService:
         return partial_answers
 
     def generate_partial_answer(self, query, summary):
-        """Generate a partial answer from the summary"""
+        """Generate a partial answer from the summary, scored for relevance in the same call"""
         # Use gpt-4o-mini to generate a partial answer from the summary
         prompt = f"""
         You are a helpful assistant. Your task is to generate a partial answer from the following summary:
@@ -165,49 +467,106 @@ class LLMService:
         **Summary**: "{summary}"
 
         **Query**: "{query}"
+
+        Rate how relevant the summary is to the query from 0 (irrelevant) to 100 (fully answers it).
+
+        **Output format** (JSON):
+        {{"relevance": <0-100>, "answer": "<partial answer>"}}
         """
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini", prompt=prompt, max_tokens=200
+        # The score comes first and the limit leaves room for the JSON
+        # wrapping, so a long answer is not cut off before it parses
+        content = self._cached_completion(
+            prompt,
+            model="gpt-4o-mini",
+            max_tokens=500,
+            response_format={"type": "json_object"},
         )
-        return response.choices[0].text.strip()
+        try:
+            parsed = json.loads(content)
+            return str(parsed.get("answer", "")).strip(), float(parsed.get("relevance", 0))
+        except (ValueError, TypeError, AttributeError) as e:
+            # Scored 0, so rank_answers drops it; say so rather than losing it silently
+            print(f"Error parsing partial answer, dropping it ({len(content)} chars): {e}")
+            return content.strip(), 0.0
+
+    def rank_answers(self, partial_answers, threshold=50, k=None):
+        """
+        Return the (answer, score) pairs scoring above `threshold`, best first.
 
-    def rank_answers(self, partial_answers, threshold=50):
-        scored_answers = [
-            (answer, score) for answer, score in partial_answers if score > threshold
-        ]
-        ranked_answers = sorted(scored_answers, key=lambda x: x[1], reverse=True)
-        return ranked_answers
+        When `k` is given only the top `k` are returned; they are selected with
+        np.argpartition so only those k get sorted.
+        """
+        if not partial_answers:
+            return []
+        scores = np.fromiter(
+            (score for _, score in partial_answers),
+            dtype=np.float64,
+            count=len(partial_answers),
+        )
+        candidates = np.flatnonzero(scores > threshold)
+        if k is not None and k < len(candidates):
+            top = np.argpartition(scores[candidates], -k)[-k:]
+            candidates = np.sort(candidates[top])
+        # Stable sort keeps the original order for tied scores
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(partial_answers[i][0], partial_answers[i][1]) for i in candidates]
 
-    def generate_global_answer(self, query, top_answers):
+    @staticmethod
+    def _global_answer_messages(top_answers):
         # Combine the top N answers into a final global answer
         combined_answers = "\n".join([answer for answer, score in top_answers])
+        return [
+            {
+                "role": "user",
+                "content": f"Summarize the following partial answers into a final global response:\n\n{combined_answers}",
+            }
+        ]
+
+    def generate_global_answer(self, query, top_answers):
         response = self.client.chat.completions.create(
             model="gpt-4o-mini",
-            prompt=f"Summarize the following partial answers into a final global response:\n\n{combined_answers}",
+            messages=self._global_answer_messages(top_answers),
             max_tokens=200,
         )
-        return response.choices[0].text.strip()
+        return response.choices[0].message.content.strip()
 
-    def handle_query(self, query):
+    def generate_global_answer_stream(self, query, top_answers):
+        """Yield the global answer text incrementally as the model produces it."""
+        stream = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=self._global_answer_messages(top_answers),
+            max_tokens=200,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def rank_query_answers(self, query):
+        """Run steps 1-3 of the query pipeline and return the top-ranked partial answers."""
         # Step 1: Retrieve relevant summaries from the graph
         normalized_request = self.normalize_request(query)
-        if normalized_request.get("type") == "global":
-            summaries = self.select_community_summaries(normalized_request)
-        elif normalized_request.get("type") == "entity":
+        if normalized_request.get("type") == "entity":
             summaries = self.select_relevant_summaries(normalized_request)
+        else:
+            summaries = self.select_community_summaries(normalized_request)
 
         # Step 2: Generate partial answers from community summaries
         partial_answers = self.map_step(summaries, query)
 
         # Step 3: Rank and filter partial answers
-        ranked_answers = self.rank_answers(partial_answers)
+        return self.rank_answers(partial_answers, k=5)  # Top 5 answers
+
+    def handle_query(self, query):
+        ranked_answers = self.rank_query_answers(query)
 
         # Step 4: Combine top-ranked answers into a global answer
-        global_answer = self.generate_global_answer(
-            query, ranked_answers[:5]
-        )  # Top 5 answers
+        return self.generate_global_answer(query, ranked_answers)
 
-        return global_answer
+    def handle_query_stream(self, query):
+        """Like handle_query, but yields the final answer as it is generated."""
+        ranked_answers = self.rank_query_answers(query)
+        yield from self.generate_global_answer_stream(query, ranked_answers)
 
     def generate_report(self, document_ids, report_type, custom_prompt):
         try:
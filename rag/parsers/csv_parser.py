@@ -29,6 +29,27 @@ except ImportError:
     PANDAS_AVAILABLE = False
     logger.warning("pandas not available. CSV parsing will be limited.")
 
+# Column name standardization: spaces and hyphens become underscores and
+# special characters are dropped
+_CLEAN_TRANS = str.maketrans({' ': '_', '-': '_', **{c: None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'}})
+
+def _frame_rows(df: "pd.DataFrame") -> List[List[Any]]:
+    """
+    Convert a DataFrame to row lists with None for missing values.
+    
+    Columns are converted one at a time, so only columns holding NaN/NA pay
+    for an object cast and the whole frame is never copied to object dtype.
+    """
+    column_lists = []
+    for index in range(df.shape[1]):
+        series = df.iloc[:, index]
+        if series.hasnans:
+            series = series.astype(object).where(series.notna(), None)
+        column_lists.append(series.tolist())
+    if not column_lists:
+        return [[] for _ in range(len(df))]
+    return [list(row) for row in zip(*column_lists)]
+
 def detect_encoding(file_path: str) -> str:
     """
     Detect the encoding of a CSV file.
@@ -201,11 +222,7 @@ def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     try:
         # 1. Standardize column names
-        df.columns = [str(col).lower().strip()
-                      .replace(' ', '_')
-                      .replace('-', '_')
-                      .translate({ord(c): None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'})  
-                      for col in df.columns]
+        df.columns = [str(col).lower().strip().translate(_CLEAN_TRANS) for col in df.columns]
         standardized_columns = df.columns.tolist()
         
         # 2. Handle missing values
@@ -222,23 +239,26 @@ def clean_and_transform_data(data: Dict[str, Any]) -> Dict[str, Any]:
             logger.info(f"Removed {initial_row_count - len(df)} duplicate rows from CSV")
         
         # 5. Handle outliers for numerical columns
+        # IQR bounds for all columns with sufficient data points in one block op
         numerical_cols = df.select_dtypes(include=np.number).columns
-        for col in numerical_cols:
-            if df[col].count() > 10: # Check for sufficient data points
-                 Q1 = df[col].quantile(0.25)
-                 Q3 = df[col].quantile(0.75)
-                 IQR = Q3 - Q1
-                 lower_bound = Q1 - 1.5 * IQR
-                 upper_bound = Q3 + 1.5 * IQR
-                 outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-                 if not outliers.empty:
-                     df.loc[outliers.index, col] = np.nan # Replace outliers with NaN
-                     logger.info(f"Handled {len(outliers)} outliers in column '{col}'")
+        numerical_cols = numerical_cols[df[numerical_cols].count() > 10]
+        if len(numerical_cols):
+            numerical = df[numerical_cols]
+            quartiles = numerical.quantile([0.25, 0.75])
+            IQR = quartiles.loc[0.75] - quartiles.loc[0.25]
+            lower_bound = quartiles.loc[0.25] - 1.5 * IQR
+            upper_bound = quartiles.loc[0.75] + 1.5 * IQR
+            outliers = numerical.lt(lower_bound) | numerical.gt(upper_bound)
+            if outliers.values.any():
+                df[numerical_cols] = numerical.mask(outliers) # Replace outliers with NaN
+                for col, count in outliers.sum().items():
+                    if count:
+                        logger.info(f"Handled {count} outliers in column '{col}'")
             
         # Store the cleaned data
         cleaned_data = {
             "columns": standardized_columns,
-            "data": df.astype(object).where(pd.notnull(df), None).values.tolist(), # Convert back to list of lists
+            "data": _frame_rows(df), # Convert back to list of lists
             # "dataframe": df, # Keep DataFrame ONLY if needed for further steps
             "shape": df.shape,
             "dtypes": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
@@ -283,7 +303,7 @@ def transform_numerical_data(data: Dict[str, Any]) -> Dict[str, Any]:
                  df[col] = numeric_col.astype('float') # Use float
                  
         # Convert DataFrame back to list of lists with standard types
-        data["data"] = df.astype(object).where(pd.notnull(df), None).values.tolist()
+        data["data"] = _frame_rows(df)
         data["dtypes"] = {str(col): str(dtype) for col, dtype in df.dtypes.items()} # Update dtypes
 
     except Exception as e:
@@ -19,11 +19,15 @@ def extract_text_from_docx(file_path: str) -> str:
         logger.error(f"Error extracting text from DOCX '{os.path.basename(file_path)}': {str(e)}")
         return ""
 
-def extract_tables_with_context(doc: Document) -> List[Dict[str, Any]]:
+def extract_tables_with_context(doc: Document, paragraphs: List[Any] = None) -> List[Dict[str, Any]]:
     """Extract tables with preceding paragraph as title where possible."""
     tables_data = []
     # Consider all elements (paragraphs and tables) in order
     doc_elements = list(doc.element.body)
+    # doc.tables and doc.paragraphs build new lists on every access; read
+    # them once instead of once per table
+    tables = doc.tables
+    paragraph_texts = None
     
     # Find the index of each table within the body elements
     table_indices = [i for i, element in enumerate(doc_elements) if element.tag.endswith('tbl')]
@@ -41,18 +45,17 @@ def extract_tables_with_context(doc: Document) -> List[Dict[str, Any]]:
                  # Simplification: Assume the paragraph immediately preceding the table *in the document flow* is the title
                  # We need a reliable way to map element index to paragraph object index
                  # For now, keep the simpler logic using doc.paragraphs index, acknowledging limitations
-                 paragraphs = [p for p in doc.paragraphs if p.text.strip()] # Get non-empty paragraphs
+                 if paragraph_texts is None: # Get non-empty paragraphs
+                      paragraph_texts = [text for text in (p.text.strip() for p in (paragraphs if paragraphs is not None else doc.paragraphs)) if text]
                  # This index mapping is likely incorrect. 
                  # A better approach might involve iterating paragraphs and checking if a table follows immediately.
                  # Sticking to previous logic for now:
-                 if table_index -1 < len(paragraphs):
-                      prev_para_text = paragraphs[table_index - 1].text.strip() # This is probably wrong index
-                      if prev_para_text:
-                          prev_title = prev_para_text
+                 if table_index -1 < len(paragraph_texts):
+                      prev_title = paragraph_texts[table_index - 1] # This is probably wrong index
         
         # Get the actual Table object using the index from doc.tables
         try:
-             table = doc.tables[idx]
+             table = tables[idx]
              table_content = [[cell.text.strip() for cell in row.cells] for row in table.rows]
              tables_data.append({"title": prev_title, "content": table_content})
         except IndexError:
@@ -60,27 +63,32 @@ def extract_tables_with_context(doc: Document) -> List[Dict[str, Any]]:
              
     return tables_data
 
-def extract_metadata_from_docx(file_path: str) -> Dict[str, Any]:
+def extract_metadata_from_docx(file_path: str, doc: Document = None, paragraphs: List[Any] = None) -> Dict[str, Any]:
     """Extract metadata including author, file size, and document statistics."""
 
     try:
-        doc = Document(file_path)
+        if doc is None:
+            doc = Document(file_path)
+        if paragraphs is None:
+            paragraphs = doc.paragraphs
         metadata = {
             "filename": os.path.basename(file_path),
             "filesize": os.path.getsize(file_path),
-            "paragraphs": len(doc.paragraphs),
+            "paragraphs": len(paragraphs),
             "tables": len(doc.tables),
             # Correct word count (approximated)
-            "word_count": sum(len(p.text.split()) for p in doc.paragraphs),
+            "word_count": sum(len(p.text.split()) for p in paragraphs),
             "page_count": "N/A" # Page count is not directly available in python-docx
         }
         try:
+            # Each core property is parsed from the XML on access, so read once
             core_props = doc.core_properties
+            created, modified = core_props.created, core_props.modified
             metadata.update({
                 "author": core_props.author or "Not available",
                 "title": core_props.title or "Not available",
-                "created": core_props.created.isoformat() if core_props.created else "Not available",
-                "modified": core_props.modified.isoformat() if core_props.modified else "Not available",
+                "created": created.isoformat() if created else "Not available",
+                "modified": modified.isoformat() if modified else "Not available",
                 "last_modified_by": core_props.last_modified_by or "Not available",
                 "revision": core_props.revision or "Not available"
             })
@@ -91,27 +99,37 @@ def extract_metadata_from_docx(file_path: str) -> Dict[str, Any]:
         logger.error(f"Error extracting metadata from DOCX '{os.path.basename(file_path)}': {str(e)}")
         return {}
 
-def extract_sections_from_docx(doc: Document) -> List[Dict[str, Any]]:
+def extract_sections_from_docx(doc: Document, paragraphs: List[Any] = None) -> List[Dict[str, Any]]:
     """Extract structured sections from a DOCX document based on styles or heuristics."""
+    if paragraphs is None:
+        paragraphs = doc.paragraphs
     sections = []
     current_section = "Introduction" # Default first section
     current_content = []
 
-    for para in doc.paragraphs:
+    for para in paragraphs:
         text = para.text.strip()
-        # Check if style indicates a heading (more reliable)
-        is_heading = para.style and para.style.name.startswith('Heading')
+        if not text: # Empty paragraphs neither start nor extend a section
+            continue
         
         # Heuristic: Check if text is short, capitalized, or ends with colon (less reliable)
-        is_heuristic_heading = (len(text) > 0 and len(text) < 100 and (text.isupper() or text.endswith(':')))
+        is_heuristic_heading = (len(text) < 100 and (text.isupper() or text.endswith(':')))
+        
+        # Check if style indicates a heading (more reliable); python-docx
+        # resolves .style with a lookup in the styles part, so only do it
+        # once and only when the heuristic has not already decided
+        is_heading = is_heuristic_heading
+        if not is_heading:
+            style = para.style
+            is_heading = style is not None and style.name.startswith('Heading')
 
-        if text and (is_heading or is_heuristic_heading):
+        if is_heading:
             # Found a potential heading
             if current_content: # Save previous section if content exists
                 sections.append({"heading": current_section, "content": "\n".join(current_content)})
             current_section = text # Start new section
             current_content = [] # Reset content
-        elif text: # Not a heading, but has content
+        else: # Not a heading, but has content
             current_content.append(text)
     
     # Add the last section
@@ -119,8 +137,8 @@ def extract_sections_from_docx(doc: Document) -> List[Dict[str, Any]]:
         sections.append({"heading": current_section, "content": "\n".join(current_content)})
         
     # If no sections were found, treat the whole document as one section
-    if not sections and doc.paragraphs:
-         full_text = "\n".join(p.text.strip() for p in doc.paragraphs if p.text.strip())
+    if not sections and paragraphs:
+         full_text = "\n".join(p.text.strip() for p in paragraphs if p.text.strip())
          if full_text:
              sections.append({"heading": "Full Document", "content": full_text})
              
@@ -130,17 +148,20 @@ def parse_docx(file_path: str) -> Dict[str, Any]:
     """Parse DOCX file into structured metadata, text, sections, and tables."""
     try:
          doc = Document(file_path)
+         # Load the document and its paragraph list once and share them
+         # across the extraction passes
+         paragraphs = doc.paragraphs
          # Note: Extract sections before text to potentially use heading info
-         sections = extract_sections_from_docx(doc)
+         sections = extract_sections_from_docx(doc, paragraphs)
          text = "\n".join(s['content'] for s in sections) # Reconstruct text from sections
          if not text: # Fallback if section extraction failed
-             text = extract_text_from_docx(file_path)
+             text = "\n".join(para.text.strip() for para in paragraphs if para.text.strip())
              
          return {
-             "metadata": extract_metadata_from_docx(file_path),
+             "metadata": extract_metadata_from_docx(file_path, doc, paragraphs),
              "text": text,
              "sections": sections,
-             "tables": extract_tables_with_context(doc)
+             "tables": extract_tables_with_context(doc, paragraphs)
          }
     except Exception as e:
          logger.error(f"Failed to parse DOCX file '{os.path.basename(file_path)}': {e}")
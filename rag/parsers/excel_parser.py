@@ -48,6 +48,10 @@ except ImportError:
     OPENPYXL_AVAILABLE = False
     logger.warning("openpyxl not available. Complex Excel parsing will be limited.")
 
+# Column name standardization: spaces and hyphens become underscores and
+# special characters are dropped
+_CLEAN_TRANS = str.maketrans({' ': '_', '-': '_', **{c: None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'}})
+
 def extract_data_with_pandas(file_path: str) -> Dict[str, Any]:
     """
     Extract data from an Excel file using pandas.
@@ -320,11 +324,7 @@ def clean_and_transform_data(sheets_data: Dict[str, Any]) -> Dict[str, Any]:
             df = pd.DataFrame(normalized_data, columns=headers)
 
             # 1. Standardize column names
-            df.columns = [str(col).lower().strip()
-                          .replace(' ', '_')
-                          .replace('-', '_')
-                          .translate({ord(c): None for c in '!@#$%^&*()[]{};:,./<>?\\|`~=+'}) 
-                          for col in df.columns]
+            df.columns = [str(col).lower().strip().translate(_CLEAN_TRANS) for col in df.columns]
             standardized_columns = df.columns.tolist()
 
             # 2. Handle missing values
@@ -0,0 +1,294 @@
+import threading
+import time
+from unittest.mock import MagicMock
+import numpy as np
+from rag import llmservice
+from rag.llmservice import LLMCache, LLMService
+
+
+def _embedding_response(vector):
+    item = MagicMock()
+    item.embedding = vector
+    response = MagicMock()
+    response.data = [item]
+    return response
+
+
+def test_llm_cache_exact_hit_and_lru_eviction():
+    cache = LLMCache(maxsize=2)
+    key_a = LLMCache.make_key("gpt-4o-mini", "a")
+    key_b = LLMCache.make_key("gpt-4o-mini", "b")
+    key_c = LLMCache.make_key("gpt-4o-mini", "c")
+
+    cache.put(key_a, "answer a")
+    cache.put(key_b, "answer b")
+    assert cache.get(key_a) == "answer a"  # refreshes a
+
+    cache.put(key_c, "answer c")  # evicts b, the least recently used
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == "answer a"
+    assert cache.get(key_c) == "answer c"
+
+
+def test_llm_cache_key_depends_on_model():
+    assert LLMCache.make_key("gpt-4o-mini", "q") != LLMCache.make_key("gpt-3.5-turbo", "q")
+
+
+def test_llm_cache_semantic_lookup():
+    client = MagicMock()
+    client.embeddings.create.return_value = _embedding_response([1.0, 0.0])
+    cache = LLMCache(client=client, similarity_threshold=0.95)
+
+    embedding = cache.embed("key trends in 2023")
+    cache.put(LLMCache.make_key("m", "p"), "cached answer", embedding)
+
+    near = np.array([0.99, 0.05], dtype=np.float32)
+    far = np.array([0.0, 1.0], dtype=np.float32)
+    assert cache.lookup_similar(near / np.linalg.norm(near)) == "cached answer"
+    assert cache.lookup_similar(far) is None
+
+
+def test_llm_cache_persists_to_sqlite(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    key = LLMCache.make_key("gpt-4o-mini", "prompt")
+    LLMCache(path=path).put(key, "persisted answer")
+
+    assert LLMCache(path=path).get(key) == "persisted answer"
+
+
+
+def test_llm_cache_is_safe_across_threads(tmp_path):
+    cache = LLMCache(maxsize=8, path=str(tmp_path / "llm_cache.sqlite"))
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(50):
+                key = LLMCache.make_key("m", f"{n}-{i}")
+                cache.put(key, f"answer {n}-{i}")
+                assert cache.get(key) is not None
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache.exact) == 8
+
+
+def _service_with_session(rows):
+    service = LLMService.__new__(LLMService)
+    record = MagicMock()
+    record.data.return_value = rows
+    service.session = MagicMock()
+    service.session.run.return_value = [record]
+    return service
+
+
+def test_cached_query_reuses_results_within_ttl():
+    LLMService.invalidate()
+    service = _service_with_session({"n.summary": "summary"})
+
+    first = service._cached_query("MATCH (n:Summary) RETURN n.summary")
+    second = service._cached_query("MATCH (n:Summary) RETURN n.summary")
+
+    assert first == second == [{"n.summary": "summary"}]
+    service.session.run.assert_called_once()
+
+    LLMService.invalidate()
+    service._cached_query("MATCH (n:Summary) RETURN n.summary")
+    assert service.session.run.call_count == 2
+
+
+def test_cached_query_expires_after_ttl():
+    LLMService.invalidate()
+    service = _service_with_session({"n.summary": "summary"})
+
+    service._cached_query("MATCH (n:Summary) RETURN n.summary", ttl=0)
+    service._cached_query("MATCH (n:Summary) RETURN n.summary", ttl=0)
+
+    assert service.session.run.call_count == 2
+
+
+def test_graph_writes_invalidate_cached_queries():
+    from rag.initialize_neo4j import Neo4jGraphInitializer
+
+    LLMService.invalidate()
+    service = _service_with_session({"n.summary": "summary"})
+    service._cached_query("MATCH (n:Summary) RETURN n.summary")
+
+    initializer = Neo4jGraphInitializer()
+    initializer.driver = MagicMock()
+    initializer.createOrgNode("org-1")
+
+    service._cached_query("MATCH (n:Summary) RETURN n.summary")
+    assert service.session.run.call_count == 2
+
+
+def test_classify_without_llm_short_and_global_queries():
+    assert LLMService.classify_without_llm("  ")["type"] == "global"
+    assert LLMService.classify_without_llm("What are the key trends in sustainability?") == {
+        "query": "What are the key trends in sustainability?",
+        "type": "global",
+        "entities": [],
+    }
+
+
+def test_classify_without_llm_defers_entity_queries():
+    assert LLMService.classify_without_llm("What were Tesla's labor practices like in 2023?") is None
+    assert LLMService.classify_without_llm("Summarize the overall ESG risks") is None
+
+
+def test_normalize_request_skips_llm_for_trivial_queries():
+    service = LLMService.__new__(LLMService)
+    service.client = MagicMock()
+    service.cache = LLMCache()
+
+    assert service.normalize_request("hi")["type"] == "global"
+    service.client.chat.completions.create.assert_not_called()
+
+
+def test_normalize_request_does_not_reuse_near_duplicate_classifications():
+    service = LLMService.__new__(LLMService)
+    service.model = "gpt-3.5-turbo"
+    service.client = MagicMock()
+    service.client.embeddings.create.return_value = _embedding_response([1.0, 0.0])
+    service.cache = LLMCache(client=service.client)
+    service.client.chat.completions.create.side_effect = [
+        _completion_response('{"query": "q", "type": "entity", "entities": ["Tesla 2022"]}'),
+        _completion_response('{"query": "q", "type": "entity", "entities": ["Tesla 2023"]}'),
+    ]
+
+    first = service.normalize_request("What were Tesla's labor practices in 2022?")
+    second = service.normalize_request("What were Tesla's labor practices in 2023?")
+
+    assert first["entities"] == ["Tesla 2022"]
+    assert second["entities"] == ["Tesla 2023"]
+    service.client.embeddings.create.assert_not_called()
+
+
+def test_openai_client_is_shared(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llmservice, "_openai_client", None)
+
+    assert llmservice._get_openai_client() is llmservice._get_openai_client()
+
+
+def test_rank_answers_filters_and_orders():
+    service = LLMService.__new__(LLMService)
+    answers = [("a", 40), ("b", 90), ("c", 70), ("d", 90), ("e", 55)]
+
+    assert service.rank_answers(answers) == [("b", 90), ("d", 90), ("c", 70), ("e", 55)]
+    assert service.rank_answers(answers, k=2) == [("b", 90), ("d", 90)]
+    assert service.rank_answers([]) == []
+
+
+def test_dedupe_summaries_keeps_first_occurrence():
+    summaries = ["water use", "emissions", "water use", None, "emissions", "waste"]
+    assert llmservice.dedupe_summaries(summaries) == ["water use", "emissions", "waste"]
+
+
+def test_dedupe_summaries_without_xxhash(monkeypatch):
+    monkeypatch.setattr(llmservice, "XXHASH_AVAILABLE", False)
+    assert llmservice.dedupe_summaries(["a", "b", "a"]) == ["a", "b"]
+
+
+def _completion_response(content):
+    message = MagicMock()
+    message.content = content
+    choice = MagicMock()
+    choice.message = message
+    response = MagicMock()
+    response.choices = [choice]
+    return response
+
+
+def test_generate_partial_answer_returns_answer_and_relevance():
+    service = LLMService.__new__(LLMService)
+    service.model = "gpt-3.5-turbo"
+    service.cache = LLMCache()
+    service.client = MagicMock()
+    service.client.chat.completions.create.return_value = _completion_response(
+        '{"answer": " Emissions fell 10%. ", "relevance": 85}'
+    )
+
+    answer = service.generate_partial_answer("How did emissions change?", "summary text")
+
+    assert answer == ("Emissions fell 10%.", 85.0)
+    assert service.rank_answers([answer]) == [answer]
+
+
+def test_generate_partial_answer_reports_unparseable_output(capsys):
+    service = LLMService.__new__(LLMService)
+    service.model = "gpt-3.5-turbo"
+    service.cache = LLMCache()
+    service.client = MagicMock()
+    service.client.chat.completions.create.return_value = _completion_response(
+        '{"relevance": 90, "answer": "Emissions fell'
+    )
+
+    answer = service.generate_partial_answer("How did emissions change?", "summary text")
+
+    assert answer[1] == 0.0
+    assert service.rank_answers([answer]) == []
+    assert "Error parsing partial answer" in capsys.readouterr().out
+    assert service.client.chat.completions.create.call_args.kwargs["max_tokens"] > 200
+
+
+def _stream_chunk(text):
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = text
+    return chunk
+
+
+def test_generate_global_answer_stream_yields_deltas():
+    service = LLMService.__new__(LLMService)
+    service.client = MagicMock()
+    service.client.chat.completions.create.return_value = iter(
+        [_stream_chunk("Emissions "), _stream_chunk(None), _stream_chunk("fell.")]
+    )
+
+    parts = list(service.generate_global_answer_stream("q", [("Emissions fell.", 90.0)]))
+
+    assert parts == ["Emissions ", "fell."]
+    assert service.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+def test_cached_completion_coalesces_concurrent_calls():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_create(**kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return _completion_response("shared answer")
+
+    service = LLMService.__new__(LLMService)
+    service.model = "gpt-3.5-turbo"
+    # A cache that never hits, so only the in-flight call can be shared
+    service.cache = MagicMock()
+    service.cache.get.return_value = None
+    service.client = MagicMock()
+    service.client.chat.completions.create.side_effect = slow_create
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service._cached_completion("p")))
+        for _ in range(2)
+    ]
+    threads[0].start()
+    started.wait(timeout=5)
+    threads[1].start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["shared answer", "shared answer"]
+    service.client.chat.completions.create.assert_called_once()
+    assert not llmservice._inflight